@@ -1,8 +1,10 @@
 
-import os
-import requests
+import asyncio
+import json
 from pathlib import Path
 
+import aiohttp
+
 
 # Drop the URLs of the PDFs to download here
 urls = [
@@ -15,30 +17,128 @@ urls = [
 # Download location
 download_destination = Path("documents/pdfs")
 
-# Create the directory if it doesn't exist
-download_destination.mkdir(parents=True, exist_ok=True)
+# Connection cap per host (all the arXiv URLs share one host)
+LIMIT_PER_HOST = 8
+
+# Sidecar file tracking ETag/Last-Modified per URL for conditional GETs
+CACHE_FILE = download_destination / ".etags.json"
+
+# Transient server errors worth retrying with backoff
+RETRY_STATUSES = {502, 503, 504}
+MAX_ATTEMPTS = 3
+BACKOFF_SECONDS = 0.5
+
 
-for url in urls:
+def load_cache() -> dict:
+    """Load the ETag/Last-Modified cache from the sidecar file."""
     try:
-        # Get the filename from the URL and add .pdf extension
-        filename = url.split("/")[-1] + ".pdf"
-        file_path = download_destination / filename
-        
-        print(f"Downloading {filename} from {url}...")
-        
-        # Download the PDF
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()  # Raise an exception for bad status codes
-        
-        # Save the PDF to the download destination
-        with open(file_path, "wb") as f:
-            f.write(response.content)
-            
-        print(f"Successfully downloaded {filename}")
-        
-    except requests.exceptions.RequestException as e:
-        print(f"Failed to download {url}: {e}")
-    except Exception as e:
-        print(f"Error saving {filename}: {e}")
-
-print(f"\nDownload complete! Files saved to: {download_destination.absolute()}")
\ No newline at end of file
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache: dict):
+    """Save the ETag/Last-Modified cache to the sidecar file."""
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+
+
+async def download_pdf(session: aiohttp.ClientSession, url: str,
+                       destination: Path, cache: dict) -> str:
+    """
+    Download a single PDF over the shared session.
+
+    Args:
+        session: Shared aiohttp session (reuses connections to the host)
+        url: URL of the PDF to download
+        destination: Directory to save the PDF to
+        cache: ETag/Last-Modified cache keyed by URL
+
+    Returns:
+        The saved filename
+    """
+    # Get the filename from the URL and add .pdf extension
+    filename = url.split("/")[-1] + ".pdf"
+    file_path = destination / filename
+
+    # Send validators from a previous download so the server can reply
+    # 304 Not Modified instead of resending the whole file
+    headers = {}
+    cached = cache.get(url, {})
+    if file_path.exists():
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    print(f"Downloading {filename} from {url}...")
+
+    for attempt in range(MAX_ATTEMPTS):
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                print(f"{filename} is unchanged, skipping download")
+                return filename
+
+            if response.status in RETRY_STATUSES and attempt < MAX_ATTEMPTS - 1:
+                await asyncio.sleep(BACKOFF_SECONDS * 2 ** attempt)
+                continue
+
+            response.raise_for_status()  # Raise an exception for bad status codes
+
+            # Stream the PDF to disk in 1 MiB chunks so memory stays constant
+            # regardless of file size; the writes run in a thread so they do
+            # not block the other downloads on the event loop. The stream
+            # goes to a temp file that only replaces the real one once the
+            # download finishes, so an interrupted download can never leave
+            # a truncated PDF behind whose cached validators still match
+            tmp_path = file_path.with_suffix(file_path.suffix + ".part")
+            try:
+                with open(tmp_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(1 << 20):
+                        await asyncio.to_thread(f.write, chunk)
+                tmp_path.replace(file_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            # Record validators for the next run, only now that the file is
+            # complete and in place
+            cache[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+
+            return filename
+
+
+async def main():
+    # Create the directory if it doesn't exist
+    download_destination.mkdir(parents=True, exist_ok=True)
+
+    cache = load_cache()
+
+    # One session shared by all downloads so TCP/TLS connections and the
+    # resolved DNS entry are reused across requests
+    connector = aiohttp.TCPConnector(limit_per_host=LIMIT_PER_HOST, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=300, sock_connect=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(
+            *(download_pdf(session, url, download_destination, cache) for url in urls),
+            return_exceptions=True,
+        )
+
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"Failed to download {url}: {result}")
+        else:
+            print(f"Successfully downloaded {result}")
+
+    save_cache(cache)
+
+    print(f"\nDownload complete! Files saved to: {download_destination.absolute()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,8 @@
 import os
 import asyncio
-import json
-from datetime import datetime
+import orjson
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
 from agents.mcp import MCPServerStdio, MCPServer
@@ -25,17 +26,27 @@ def save_qa_data(qa_data: list, filename: str = "agent_qa_log.json"):
     output_dir.mkdir(parents=True, exist_ok=True)
     
     filepath = output_dir / filename
-    
+
+    # Questions record a cheap nanosecond snapshot; format it as ISO 8601
+    # only here, once, at serialization time
+    for qa_pair in qa_data:
+        timestamp_ns = qa_pair.pop("timestamp_ns", None)
+        if timestamp_ns is not None:
+            qa_pair["timestamp"] = datetime.fromtimestamp(
+                timestamp_ns / 1e9, tz=timezone.utc
+            ).isoformat()
+
     # Prepare the data structure
     output_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "total_questions": len(qa_data),
         "qa_pairs": qa_data
     }
     
-    # Write to file, overwriting previous content
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # Write to file, overwriting previous content (orjson emits UTF-8 bytes
+    # directly and is several times faster than stdlib json on long responses)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(output_data, default=str, option=orjson.OPT_INDENT_2))
     
     print(f"Q&A data saved to: {filepath}")
 
@@ -59,70 +70,53 @@ async def run(server: MCPServer):
         mcp_servers=[server],
     )
     
-    # List to store all Q&A pairs
-    qa_data = []
-    
+    # Bound how many questions are in flight at once
+    semaphore = asyncio.Semaphore(3)
+
     # Helper function to run a question and capture the response
-    async def ask_question(question: str, question_type: str = "general"):
-        print(f"\n{'='*60}")
-        print(f"Question ({question_type}): {question}")
-        print(f"{'='*60}")
-        
-        response = await Runner.run(starting_agent=agent, input=question)
-        print(f"Response: {response}")
-        
-        # Store the Q&A pair
-        qa_pair = {
-            "question": question,
-            "question_type": question_type,
-            "response": response.final_output,
-            "timestamp": datetime.now().isoformat()
-        }
-        qa_data.append(qa_pair)
-        
-        return response
-    
-    # Starter question to ensure server is responsive
-    await ask_question(
+    async def ask_question(question: str, question_type: str = "general") -> dict:
+        async with semaphore:
+            print(f"\n{'='*60}")
+            print(f"Question ({question_type}): {question}")
+            print(f"{'='*60}")
+
+            response = await Runner.run(starting_agent=agent, input=question)
+            print(f"Response: {response}")
+
+            # Return the Q&A pair
+            return {
+                "question": question,
+                "question_type": question_type,
+                "response": response.final_output,
+                "timestamp_ns": time.time_ns()
+            }
+
+    # Starter question runs alone so it stays a server warmup
+    qa_data = [await ask_question(
         "Test the server functionality first, then let me know if you are ready to answer questions.",
         "server_test"
-    )
-    
-    # Basic question:
-    await ask_question(
-        "What are the titles of all the papers in the database?",
-        "basic"
-    )
-    
-    # Test ability to collection metadata from the collections
-    await ask_question(
-        "What are the names of each of the collections, and how many documents are in each collection?",
-        "metadata"
-    )
-    
-    # More complex question:
-    await ask_question(
-        "What does the paper on Ensemble Retrieval Strategies aim to research?",
-        "research_analysis"
-    )
-    
-    # Test ability to extract table information from a paper
-    await ask_question(
-        "What do testing results look like for the paper on Ensemble Retrieval Strategies?",
-        "table_extraction"
-    )
-    
-    # Hard questions
-    await ask_question(
-        "What is the title of the paper that has the highest number of citations?",
-        "advanced_analysis"
-    )
-    
-    await ask_question(
-        "What is the best performing model in the Attention is all you need paper for EN-FR?",
-        "advanced_analysis"
-    )
-    
+    )]
+
+    # The remaining questions are independent, so run them concurrently;
+    # gather preserves the original question order in qa_data
+    questions = [
+        # Basic question:
+        ("What are the titles of all the papers in the database?", "basic"),
+        # Test ability to collection metadata from the collections
+        ("What are the names of each of the collections, and how many documents are in each collection?", "metadata"),
+        # More complex question:
+        ("What does the paper on Ensemble Retrieval Strategies aim to research?", "research_analysis"),
+        # Test ability to extract table information from a paper
+        ("What do testing results look like for the paper on Ensemble Retrieval Strategies?", "table_extraction"),
+        # Hard questions
+        ("What is the title of the paper that has the highest number of citations?", "advanced_analysis"),
+        ("What is the best performing model in the Attention is all you need paper for EN-FR?", "advanced_analysis"),
+    ]
+
+    qa_data.extend(await asyncio.gather(
+        *(ask_question(question, question_type) for question, question_type in questions)
+    ))
+
     # Save all Q&A data to file
     save_qa_data(qa_data)
     
@@ -12,12 +12,19 @@ The pipeline only processes files that don't already have corresponding output f
 ensuring efficient incremental processing.
 """
 
+import asyncio
 import os
 import sys
-import json
+import orjson
 import logging
+import queue
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import nullcontext
+from dataclasses import dataclass
+from enum import IntFlag, auto
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -28,11 +35,85 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import pipeline components
 from src.doc_parser import generate_html_from_pdf
-from src.html_parser import parse_html_content, save_chunks_to_json
-from src.chunker import convert_json_to_database_format
+from src.html_parser import parse_html_content, save_chunks_to_json, chunks_to_json
+from src.chunker import convert_chunks_to_database_records
 from src.build_chroma import ChromaDocumentIngester
 
 
+@dataclass(slots=True)
+class PdfPaths:
+    """Resolved input and per-stage output paths for one PDF."""
+    pdf: Path
+    html: Path
+    json: Path
+    db: Path
+
+
+class Stage(IntFlag):
+    """
+    Bitmask of completed pipeline stages for one PDF.
+
+    Success checks are single bit operations (mask == Stage.ALL) instead of
+    dict-of-bools traversals; stage names are only materialized for reporting.
+    """
+    HTML = auto()
+    PROCESS = auto()
+    CHROMA = auto()
+    ALL = HTML | PROCESS | CHROMA
+
+
+def _run_file_stages(paths: PdfPaths,
+                     stages: Dict[str, bool],
+                     dump_intermediates: bool = False
+                     ) -> Tuple['Stage', Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Run the fused in-memory processing stage (HTML to chunks to database
+    records) for a single PDF. The network-bound Gemini stage runs beforehand
+    in the parent's async stage-1 pass.
+
+    The HTML is parsed and converted to database records entirely in memory,
+    so the document text is no longer written and re-read between stages.
+    The chunks JSON and database JSON artifacts are only written when
+    dump_intermediates is set.
+
+    This runs in a worker process, which inherits the parent's queue-based
+    logging configuration but not the listener thread that drains the queue —
+    so nothing is logged here. Failures are reported back to the parent as
+    the error element of the return tuple instead.
+
+    Args:
+        paths: Resolved paths for the PDF and its stage outputs
+        stages: Which stages need to run for this PDF
+        dump_intermediates: Also write the chunks/database JSON files
+
+    Returns:
+        (completed-stage mask, database records or None on failure/skip,
+        error message or None)
+    """
+    completed = Stage.PROCESS
+    records = None
+    error = None
+
+    if stages.get('process'):
+        try:
+            html_content = paths.html.read_text(encoding='utf-8')
+
+            chunks = parse_html_content(html_content)
+            records = convert_chunks_to_database_records(chunks_to_json(chunks))
+
+            if dump_intermediates:
+                save_chunks_to_json(chunks, str(paths.json))
+                paths.db.parent.mkdir(parents=True, exist_ok=True)
+                with open(paths.db, 'wb') as f:
+                    f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        except Exception as e:
+            error = f"Failed to process {paths.pdf.name}: {e}"
+            completed = Stage(0)
+            records = None
+
+    return completed, records, error
+
+
 class DocumentProcessingPipeline:
     """
     Orchestrates the complete document processing pipeline.
@@ -43,22 +124,33 @@ class DocumentProcessingPipeline:
                  html_folder: str = "documents/processed/HTML",
                  json_folder: str = "documents/processed/JSON",
                  database_folder: str = "documents/processed/database",
-                 chroma_persist_dir: str = "./chroma_db"):
+                 chroma_persist_dir: str = "./chroma_db",
+                 bulk: bool = False,
+                 dump_intermediates: bool = False):
         """
         Initialize the processing pipeline.
-        
+
         Args:
             pdf_folder: Directory containing PDF files
             html_folder: Directory for generated HTML files
             json_folder: Directory for parsed JSON files
             database_folder: Directory for database-ready chunks
             chroma_persist_dir: Directory for ChromaDB persistence
+            bulk: Relax SQLite durability during the Chroma ingest
+                  (faster first-time loads; re-run on crash)
+            dump_intermediates: Write the chunks/database JSON artifacts
+                  to disk for debugging (processing is in-memory by default)
         """
         self.pdf_folder = Path(pdf_folder)
         self.html_folder = Path(html_folder)
         self.json_folder = Path(json_folder)
         self.database_folder = Path(database_folder)
         self.chroma_persist_dir = Path(chroma_persist_dir)
+        self.bulk = bulk
+        self.dump_intermediates = dump_intermediates
+
+        # Cached {filename: mtime} listings per directory for needs_* checks
+        self._dir_cache: Dict[Path, Dict[str, float]] = {}
         
         # Ensure all directories exist
         self.pdf_folder.mkdir(parents=True, exist_ok=True)
@@ -78,16 +170,31 @@ class DocumentProcessingPipeline:
     
     def _setup_logging(self):
         """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('src/run_processing.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # The file and stream handlers run on a background listener thread;
+        # pipeline code only pays for enqueueing a record, never for the disk
+        # write or stdout flush
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('src/run_processing.log')
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        self._log_listener = QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+        root.addHandler(QueueHandler(log_queue))
+
         self.logger = logging.getLogger(__name__)
-    
+
+    def stop_logging(self):
+        """Flush queued log records and stop the listener thread."""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
     def _check_api_keys(self):
         """Check that required API keys are available."""
         if not os.getenv("GEMINI_API_KEY"):
@@ -110,235 +217,324 @@ class DocumentProcessingPipeline:
     def get_file_basename(self, file_path: Path) -> str:
         """Get the base name of a file (without extension)."""
         return file_path.stem
-    
-    def needs_html_processing(self, pdf_path: Path) -> bool:
+
+    def get_pdf_paths(self, pdf_path: Path) -> PdfPaths:
+        """Resolve all stage output paths for a PDF once."""
+        pdf_basename = pdf_path.stem
+        return PdfPaths(
+            pdf=pdf_path,
+            html=self.html_folder / f"{pdf_basename}.html",
+            json=self.json_folder / f"{pdf_basename}_chunks.json",
+            db=self.database_folder / f"{pdf_basename}_database.json"
+        )
+
+    def _scan(self, directory: Path) -> Dict[str, float]:
+        """
+        Return {filename: mtime} for a directory, scanning it at most once
+        per cache generation.
+
+        os.scandir returns cached stat results on Linux, so one scan per
+        directory replaces the per-file exists()/stat() syscall pairs the
+        needs_* checks would otherwise issue.
+        """
+        cached = self._dir_cache.get(directory)
+        if cached is None:
+            try:
+                cached = {entry.name: entry.stat().st_mtime for entry in os.scandir(directory)}
+            except FileNotFoundError:
+                cached = {}
+            self._dir_cache[directory] = cached
+        return cached
+
+    def _invalidate_dir_cache(self, *directories: Path):
+        """Drop cached listings for directories whose contents changed."""
+        if directories:
+            for directory in directories:
+                self._dir_cache.pop(directory, None)
+        else:
+            self._dir_cache.clear()
+
+    def needs_html_processing(self, paths: PdfPaths) -> bool:
         """Check if a PDF needs HTML processing."""
-        pdf_basename = self.get_file_basename(pdf_path)
-        html_path = self.html_folder / f"{pdf_basename}.html"
-        
-        if not html_path.exists():
-            self.logger.info(f"PDF needs HTML processing: {pdf_path.name}")
+        html_mtime = self._scan(self.html_folder).get(paths.html.name)
+
+        if html_mtime is None:
+            self.logger.debug(f"PDF needs HTML processing: {paths.pdf.name}")
             return True
-        
+
         # Check if PDF is newer than HTML
-        if pdf_path.stat().st_mtime > html_path.stat().st_mtime:
-            self.logger.info(f"PDF is newer than HTML: {pdf_path.name}")
+        pdf_mtime = self._scan(self.pdf_folder).get(paths.pdf.name, 0)
+        if pdf_mtime > html_mtime:
+            self.logger.debug(f"PDF is newer than HTML: {paths.pdf.name}")
             return True
-        
-        self.logger.info(f"HTML already exists and is current: {pdf_path.name}")
+
+        self.logger.debug(f"HTML already exists and is current: {paths.pdf.name}")
         return False
-    
-    def needs_json_processing(self, pdf_path: Path) -> bool:
+
+    def needs_json_processing(self, paths: PdfPaths) -> bool:
         """Check if a PDF needs JSON processing."""
-        pdf_basename = self.get_file_basename(pdf_path)
-        html_path = self.html_folder / f"{pdf_basename}.html"
-        json_path = self.json_folder / f"{pdf_basename}_chunks.json"
-        
-        if not html_path.exists():
-            self.logger.info(f"No HTML file for JSON processing: {pdf_path.name}")
+        html_mtime = self._scan(self.html_folder).get(paths.html.name)
+        json_mtime = self._scan(self.json_folder).get(paths.json.name)
+
+        if html_mtime is None:
+            self.logger.debug(f"No HTML file for JSON processing: {paths.pdf.name}")
             return False
-        
-        if not json_path.exists():
-            self.logger.info(f"PDF needs JSON processing: {pdf_path.name}")
+
+        if json_mtime is None:
+            self.logger.debug(f"PDF needs JSON processing: {paths.pdf.name}")
             return True
-        
+
         # Check if HTML is newer than JSON
-        if html_path.stat().st_mtime > json_path.stat().st_mtime:
-            self.logger.info(f"HTML is newer than JSON: {pdf_path.name}")
+        if html_mtime > json_mtime:
+            self.logger.debug(f"HTML is newer than JSON: {paths.pdf.name}")
             return True
-        
-        self.logger.info(f"JSON already exists and is current: {pdf_path.name}")
+
+        self.logger.debug(f"JSON already exists and is current: {paths.pdf.name}")
         return False
-    
-    def needs_database_processing(self, pdf_path: Path) -> bool:
+
+    def needs_database_processing(self, paths: PdfPaths) -> bool:
         """Check if a PDF needs database processing."""
-        pdf_basename = self.get_file_basename(pdf_path)
-        json_path = self.json_folder / f"{pdf_basename}_chunks.json"
-        database_path = self.database_folder / f"{pdf_basename}_database.json"
-        
-        if not json_path.exists():
-            self.logger.info(f"No JSON file for database processing: {pdf_path.name}")
+        json_mtime = self._scan(self.json_folder).get(paths.json.name)
+        database_mtime = self._scan(self.database_folder).get(paths.db.name)
+
+        if json_mtime is None:
+            self.logger.debug(f"No JSON file for database processing: {paths.pdf.name}")
             return False
-        
-        if not database_path.exists():
-            self.logger.info(f"PDF needs database processing: {pdf_path.name}")
+
+        if database_mtime is None:
+            self.logger.debug(f"PDF needs database processing: {paths.pdf.name}")
             return True
-        
+
         # Check if JSON is newer than database
-        if json_path.stat().st_mtime > database_path.stat().st_mtime:
-            self.logger.info(f"JSON is newer than database: {pdf_path.name}")
+        if json_mtime > database_mtime:
+            self.logger.debug(f"JSON is newer than database: {paths.pdf.name}")
             return True
-        
-        self.logger.info(f"Database already exists and is current: {pdf_path.name}")
+
+        self.logger.debug(f"Database already exists and is current: {paths.pdf.name}")
         return False
-    
-    def needs_chroma_processing(self, pdf_path: Path) -> bool:
-        """Check if a PDF needs ChromaDB processing."""
-        pdf_basename = self.get_file_basename(pdf_path)
-        database_path = self.database_folder / f"{pdf_basename}_database.json"
-        
-        if not database_path.exists():
-            self.logger.info(f"No database file for ChromaDB processing: {pdf_path.name}")
-            return False
-        
-        # For now, always process ChromaDB since we don't have a reliable way to check
-        # if the data is already in ChromaDB without querying it
-        self.logger.info(f"PDF needs ChromaDB processing: {pdf_path.name}")
-        return True
-    
-    def process_pdf_to_html(self, pdf_path: Path) -> bool:
-        """Convert PDF to HTML using Gemini AI."""
+
+    def _chroma_marker(self, paths: PdfPaths) -> Path:
+        """Path of the marker recording a successful Chroma ingest."""
+        return self.database_folder / f"{paths.pdf.stem}.chroma.done"
+
+    def _write_chroma_marker(self, paths: PdfPaths):
+        """Record the HTML mtime whose records were just ingested into Chroma."""
         try:
-            self.logger.info(f"Converting PDF to HTML: {pdf_path.name}")
-            generate_html_from_pdf(str(pdf_path))
-            self.logger.info(f"Successfully converted {pdf_path.name} to HTML")
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to convert {pdf_path.name} to HTML: {e}")
+            self._chroma_marker(paths).write_text(str(paths.html.stat().st_mtime_ns))
+        except OSError as e:
+            self.logger.warning(f"Could not write Chroma ingest marker for {paths.pdf.name}: {e}")
+
+    def needs_chroma_processing(self, paths: PdfPaths) -> bool:
+        """Check if a PDF needs ChromaDB processing."""
+        if paths.html.name not in self._scan(self.html_folder):
+            self.logger.debug(f"No HTML file for ChromaDB processing: {paths.pdf.name}")
             return False
-    
-    def process_html_to_json(self, pdf_path: Path) -> bool:
-        """Convert HTML to JSON with content type classification."""
+
+        # A marker file records the HTML mtime of the last successful ingest,
+        # so unchanged PDFs are not re-ingested on every run
         try:
-            pdf_basename = self.get_file_basename(pdf_path)
-            html_path = self.html_folder / f"{pdf_basename}.html"
-            json_path = self.json_folder / f"{pdf_basename}_chunks.json"
-            
-            self.logger.info(f"Converting HTML to JSON: {pdf_path.name}")
-            
-            # Read HTML content
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Parse HTML to chunks
-            chunks = parse_html_content(html_content)
-            
-            # Save to JSON
-            save_chunks_to_json(chunks, str(json_path))
-            
-            self.logger.info(f"Successfully converted {pdf_path.name} to JSON")
+            ingested_mtime_ns = int(self._chroma_marker(paths).read_text())
+        except (FileNotFoundError, ValueError):
+            self.logger.debug(f"PDF needs ChromaDB processing: {paths.pdf.name}")
             return True
-        except Exception as e:
-            self.logger.error(f"Failed to convert {pdf_path.name} to JSON: {e}")
-            return False
-    
-    def process_json_to_database(self, pdf_path: Path) -> bool:
-        """Convert JSON to database-ready chunks."""
-        try:
-            pdf_basename = self.get_file_basename(pdf_path)
-            json_path = self.json_folder / f"{pdf_basename}_chunks.json"
-            database_path = self.database_folder / f"{pdf_basename}_database.json"
-            
-            self.logger.info(f"Converting JSON to database: {pdf_path.name}")
-            
-            # Convert JSON to database format
-            convert_json_to_database_format(str(json_path), str(database_path))
-            
-            self.logger.info(f"Successfully converted {pdf_path.name} to database format")
+
+        if paths.html.stat().st_mtime_ns > ingested_mtime_ns:
+            self.logger.debug(f"HTML is newer than last Chroma ingest: {paths.pdf.name}")
             return True
-        except Exception as e:
-            self.logger.error(f"Failed to convert {pdf_path.name} to database format: {e}")
-            return False
-    
-    def process_database_to_chroma(self, pdf_path: Path) -> bool:
+
+        self.logger.debug(f"Already ingested into ChromaDB: {paths.pdf.name}")
+        return False
+
+    def process_database_to_chroma(self, paths: PdfPaths) -> bool:
         """Ingest database file into ChromaDB."""
         try:
-            pdf_basename = self.get_file_basename(pdf_path)
-            database_path = self.database_folder / f"{pdf_basename}_database.json"
-            
-            self.logger.info(f"Ingesting into ChromaDB: {pdf_path.name}")
-            
+            self.logger.info(f"Ingesting into ChromaDB: {paths.pdf.name}")
+
             # Ingest into ChromaDB
-            success = self.chroma_ingester.ingest_paper(str(database_path))
-            
+            success, _ = self.chroma_ingester.ingest_paper(str(paths.db))
+
             if success:
-                self.logger.info(f"Successfully ingested {pdf_path.name} into ChromaDB")
+                self.logger.info(f"Successfully ingested {paths.pdf.name} into ChromaDB")
+                self._write_chroma_marker(paths)
             else:
-                self.logger.warning(f"Failed to ingest {pdf_path.name} into ChromaDB")
-            
+                self.logger.warning(f"Failed to ingest {paths.pdf.name} into ChromaDB")
+
             return success
         except Exception as e:
-            self.logger.error(f"Failed to ingest {pdf_path.name} into ChromaDB: {e}")
+            self.logger.error(f"Failed to ingest {paths.pdf.name} into ChromaDB: {e}")
             return False
-    
-    def process_single_pdf(self, pdf_path: Path) -> Dict[str, bool]:
-        """Process a single PDF through the entire pipeline."""
-        self.logger.info(f"Processing PDF: {pdf_path.name}")
-        
-        results = {
-            'pdf_to_html': False,
-            'html_to_json': False,
-            'json_to_database': False,
-            'database_to_chroma': False
+
+    def plan_file_stages(self, paths: PdfPaths) -> Dict[str, bool]:
+        """
+        Decide which of the per-file stages need to run for a PDF.
+
+        The fused in-memory processing stage runs whenever the HTML is (re)built
+        or the last successful Chroma ingest predates the current HTML, since
+        its whole purpose is to produce records for ingest.
+        """
+        needs_html = self.needs_html_processing(paths)
+        return {
+            'pdf_to_html': needs_html,
+            'process': needs_html or self.needs_chroma_processing(paths)
         }
-        
-        # Stage 1: PDF to HTML
-        if self.needs_html_processing(pdf_path):
-            results['pdf_to_html'] = self.process_pdf_to_html(pdf_path)
-        else:
-            results['pdf_to_html'] = True  # Already processed
-        
-        # Stage 2: HTML to JSON
-        if results['pdf_to_html'] and self.needs_json_processing(pdf_path):
-            results['html_to_json'] = self.process_html_to_json(pdf_path)
-        else:
-            results['html_to_json'] = True  # Already processed
-        
-        # Stage 3: JSON to Database
-        if results['html_to_json'] and self.needs_database_processing(pdf_path):
-            results['json_to_database'] = self.process_json_to_database(pdf_path)
-        else:
-            results['json_to_database'] = True  # Already processed
-        
-        # Stage 4: Database to ChromaDB
-        if results['json_to_database'] and self.needs_chroma_processing(pdf_path):
-            results['database_to_chroma'] = self.process_database_to_chroma(pdf_path)
-        else:
-            results['database_to_chroma'] = True  # Already processed or not needed
-        
-        return results
-    
+
+    async def _stage1_all(self, pdf_paths: List[PdfPaths]) -> Dict[Path, bool]:
+        """
+        Convert PDFs to HTML concurrently.
+
+        Each Gemini call is pure network I/O, so the sequential latencies are
+        collapsed by running them through asyncio.to_thread under a semaphore
+        that bounds the request rate to avoid 429s.
+        """
+        sem = asyncio.Semaphore(4)
+
+        async def convert(paths: PdfPaths) -> bool:
+            async with sem:
+                try:
+                    self.logger.info(f"Converting PDF to HTML: {paths.pdf.name}")
+                    await asyncio.to_thread(generate_html_from_pdf, str(paths.pdf))
+                    self.logger.info(f"Successfully converted {paths.pdf.name} to HTML")
+                    return True
+                except Exception as e:
+                    self.logger.error(f"Failed to convert {paths.pdf.name} to HTML: {e}")
+                    return False
+
+        outcomes = await asyncio.gather(*(convert(paths) for paths in pdf_paths))
+        return {paths.pdf: ok for paths, ok in zip(pdf_paths, outcomes)}
+
     def run_pipeline(self) -> Dict[str, Any]:
         """Run the complete processing pipeline for all PDFs."""
         self.logger.info("Starting document processing pipeline")
-        
+
+        # Start each run with fresh directory listings
+        self._invalidate_dir_cache()
+
         pdf_files = self.get_pdf_files()
         if not pdf_files:
             self.logger.warning("No PDF files found to process")
             return {'status': 'no_files', 'processed': []}
-        
+
         results = {
             'status': 'completed',
             'total_pdfs': len(pdf_files),
             'processed': [],
             'errors': []
         }
-        
-        for pdf_path in pdf_files:
-            try:
-                pdf_result = self.process_single_pdf(pdf_path)
-                results['processed'].append({
-                    'pdf_name': pdf_path.name,
-                    'results': pdf_result,
-                    'success': all(pdf_result.values())
-                })
-                
-                if not all(pdf_result.values()):
+
+        # Resolve each PDF's stage paths and work plan exactly once; the
+        # per-file skip decisions log at debug, so a normal run prints one
+        # planned-work line instead of four lines per PDF
+        pdf_paths = [self.get_pdf_paths(pdf_path) for pdf_path in pdf_files]
+        plans = {paths.pdf: self.plan_file_stages(paths) for paths in pdf_paths}
+
+        planned_html = sum(1 for plan in plans.values() if plan['pdf_to_html'])
+        planned_process = sum(1 for plan in plans.values() if plan['process'])
+        self.logger.info(
+            f"Planned work: {planned_html} PDF-to-HTML conversions, "
+            f"{planned_process} files to process and ingest, "
+            f"{len(pdf_paths) - planned_process} already up to date"
+        )
+
+        # Stage 1: concurrent Gemini PDF-to-HTML conversions
+        stage1_pending = [paths for paths in pdf_paths if plans[paths.pdf]['pdf_to_html']]
+        html_results: Dict[Path, bool] = {}
+        if stage1_pending:
+            html_results = asyncio.run(self._stage1_all(stage1_pending))
+            self._invalidate_dir_cache(self.html_folder)
+
+        # Completed-stage bitmask per PDF; stages that did not need to run
+        # count as completed
+        stage_masks: Dict[Path, Stage] = {}
+        for paths in pdf_paths:
+            mask = Stage.HTML if html_results.get(paths.pdf, True) else Stage(0)
+            if not plans[paths.pdf]['process']:
+                mask |= Stage.PROCESS
+            stage_masks[paths.pdf] = mask
+
+        # Stages 2-3 are independent per PDF, so fan them out across a
+        # process pool; only the ChromaDB ingest (shared client) stays serial
+        max_workers = min(len(pdf_files), os.cpu_count() or 1)
+
+        records_by_pdf: Dict[Path, List[Dict[str, Any]]] = {}
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for paths in pdf_paths:
+                if stage_masks[paths.pdf] & Stage.HTML and plans[paths.pdf]['process']:
+                    self.logger.info(f"Processing HTML into database records: {paths.pdf.name}")
+                    futures[executor.submit(_run_file_stages, paths, plans[paths.pdf],
+                                            self.dump_intermediates)] = paths
+
+            for future in as_completed(futures):
+                paths = futures[future]
+                try:
+                    worker_mask, records, worker_error = future.result()
+                    if worker_error:
+                        self.logger.error(worker_error)
+                    stage_masks[paths.pdf] |= worker_mask
+                    if records is not None:
+                        records_by_pdf[paths.pdf] = records
+                except Exception as e:
+                    self.logger.error(f"Unexpected error processing {paths.pdf.name}: {e}")
+                    del stage_masks[paths.pdf]
                     results['errors'].append({
-                        'pdf_name': pdf_path.name,
-                        'failed_stages': [k for k, v in pdf_result.items() if not v]
+                        'pdf_name': paths.pdf.name,
+                        'error': str(e)
                     })
-                    
-            except Exception as e:
-                self.logger.error(f"Unexpected error processing {pdf_path.name}: {e}")
+
+        # The workers may have written new outputs, so drop the stale listings
+        self._invalidate_dir_cache(self.html_folder, self.json_folder, self.database_folder)
+
+        # Stage 4: batched ChromaDB ingest of the in-memory records of every
+        # PDF whose file stages succeeded
+        to_ingest = [
+            paths for paths in pdf_paths
+            if paths.pdf in records_by_pdf
+            and stage_masks[paths.pdf] & (Stage.HTML | Stage.PROCESS) == Stage.HTML | Stage.PROCESS
+        ]
+        ingest_pdfs = {paths.pdf for paths in to_ingest}
+
+        ingest_ctx = self.chroma_ingester.bulk_mode() if self.bulk else nullcontext()
+        with ingest_ctx:
+            ingest_results = self.chroma_ingester.ingest_records_batched(
+                [(str(paths.db), records_by_pdf[paths.pdf]) for paths in to_ingest]
+            )
+
+        # Mark successful ingests so unchanged PDFs are skipped next run
+        for paths in to_ingest:
+            if ingest_results.get(str(paths.db), False):
+                self._write_chroma_marker(paths)
+
+        for paths in pdf_paths:
+            if paths.pdf not in stage_masks:
+                continue
+
+            mask = stage_masks[paths.pdf]
+
+            if paths.pdf in ingest_pdfs:
+                if ingest_results.get(str(paths.db), False):
+                    mask |= Stage.CHROMA
+            elif mask & (Stage.HTML | Stage.PROCESS) == Stage.HTML | Stage.PROCESS:
+                # Nothing needed ingesting, which counts as success
+                mask |= Stage.CHROMA
+
+            success = mask == Stage.ALL
+
+            results['processed'].append({
+                'pdf_name': paths.pdf.name,
+                'results': {stage.name.lower(): bool(mask & stage) for stage in Stage},
+                'success': success
+            })
+
+            if not success:
                 results['errors'].append({
-                    'pdf_name': pdf_path.name,
-                    'error': str(e)
+                    'pdf_name': paths.pdf.name,
+                    'failed_stages': [stage.name.lower() for stage in Stage if not mask & stage]
                 })
-        
+
         # Print summary
         self._print_summary(results)
-        
+
         return results
     
     def _print_summary(self, results: Dict[str, Any]):
@@ -371,23 +567,25 @@ class DocumentProcessingPipeline:
     
     def get_processing_status(self) -> Dict[str, Any]:
         """Get the current processing status of all PDFs."""
+        self._invalidate_dir_cache()
+
         pdf_files = self.get_pdf_files()
         status = {
             'total_pdfs': len(pdf_files),
             'pdfs': []
         }
-        
+
         for pdf_path in pdf_files:
-            pdf_basename = self.get_file_basename(pdf_path)
+            paths = self.get_pdf_paths(pdf_path)
             pdf_status = {
                 'name': pdf_path.name,
-                'html_exists': (self.html_folder / f"{pdf_basename}.html").exists(),
-                'json_exists': (self.json_folder / f"{pdf_basename}_chunks.json").exists(),
-                'database_exists': (self.database_folder / f"{pdf_basename}_database.json").exists(),
-                'needs_html': self.needs_html_processing(pdf_path),
-                'needs_json': self.needs_json_processing(pdf_path),
-                'needs_database': self.needs_database_processing(pdf_path),
-                'needs_chroma': self.needs_chroma_processing(pdf_path)
+                'html_exists': paths.html.name in self._scan(self.html_folder),
+                'json_exists': paths.json.name in self._scan(self.json_folder),
+                'database_exists': paths.db.name in self._scan(self.database_folder),
+                'needs_html': self.needs_html_processing(paths),
+                'needs_json': self.needs_json_processing(paths),
+                'needs_database': self.needs_database_processing(paths),
+                'needs_chroma': self.needs_chroma_processing(paths)
             }
             status['pdfs'].append(pdf_status)
         
@@ -402,6 +600,10 @@ def main():
     parser.add_argument("--status", action="store_true", help="Show processing status")
     parser.add_argument("--pdf-folder", default="documents/pdfs", help="PDF folder path")
     parser.add_argument("--chroma-dir", default="./chroma_db", help="ChromaDB persistence directory")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Relax SQLite durability during Chroma ingest (faster first-time loads)")
+    parser.add_argument("--dump-intermediates", action="store_true",
+                        help="Write the chunks/database JSON artifacts to disk for debugging")
     
     args = parser.parse_args()
     
@@ -409,18 +611,24 @@ def main():
         # Initialize pipeline
         pipeline = DocumentProcessingPipeline(
             pdf_folder=args.pdf_folder,
-            chroma_persist_dir=args.chroma_dir
+            chroma_persist_dir=args.chroma_dir,
+            bulk=args.bulk,
+            dump_intermediates=args.dump_intermediates
         )
         
-        if args.status:
-            # Show status only
-            status = pipeline.get_processing_status()
-            print(json.dumps(status, indent=2))
-        else:
-            # Run full pipeline
-            results = pipeline.run_pipeline()
-            print(f"\nPipeline completed with status: {results['status']}")
-            
+        try:
+            if args.status:
+                # Show status only
+                status = pipeline.get_processing_status()
+                sys.stdout.buffer.write(orjson.dumps(status, option=orjson.OPT_INDENT_2) + b"\n")
+            else:
+                # Run full pipeline
+                results = pipeline.run_pipeline()
+                print(f"\nPipeline completed with status: {results['status']}")
+        finally:
+            # Make sure queued log records reach disk before exit
+            pipeline.stop_logging()
+
     except Exception as e:
         logging.error(f"Pipeline failed: {e}")
         sys.exit(1)
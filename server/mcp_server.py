@@ -1,8 +1,13 @@
 from typing import Dict, List
 import chromadb
 from mcp.server.fastmcp import FastMCP
+import asyncio
+import heapq
 import os
 import logging
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from dotenv import load_dotenv
 from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
@@ -16,15 +21,24 @@ def setup_logging():
     server_dir = Path(__file__).parent
     server_dir.mkdir(parents=True, exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(server_dir / 'mcp_server.log'),
-            logging.StreamHandler()  # Also log to console
-        ]
-    )
+    # Handlers run on a background listener thread, so tool coroutines only
+    # pay for enqueueing a record, never the file write and flush
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(server_dir / 'mcp_server.log')
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(logging.INFO)
+    stream_handler = logging.StreamHandler()  # Also log to console
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler,
+                             respect_handler_level=True)
+    listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
     return logging.getLogger(__name__)
 
 # Initialize logger
@@ -41,9 +55,46 @@ mcp = FastMCP("chroma")
 ##########################################################################
 
 _chroma_client = None
+_embedding_fn = None
 EMBEDDING_MODEL = "text-embedding-3-large"
 DIMENSIONS = 1536
 
+# Fields Chroma can serialize into results; anything else is dropped from
+# caller-supplied include lists so no unexpected payload is materialized
+_VALID_INCLUDE = {"documents", "metadatas", "distances", "embeddings", "uris", "data"}
+
+
+def get_embedding_function():
+    """
+    Get the shared OpenAI embedding function.
+
+    Built once and reused by every tool call, so the underlying HTTP client
+    keeps its connection pool instead of redoing DNS/TLS setup per request.
+    """
+    global _embedding_fn
+    if _embedding_fn is None:
+        logger.info("Initializing OpenAI embedding function")
+        _embedding_fn = OpenAIEmbeddingFunction(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            model_name=EMBEDDING_MODEL,
+            dimensions=DIMENSIONS
+        )
+    return _embedding_fn
+
+
+@lru_cache(maxsize=4096)
+def _embed_query(text: str) -> tuple:
+    """
+    Embed a single query text, memoized in-process.
+
+    RAG workloads repeat queries heavily, so a cache hit skips the OpenAI
+    round-trip entirely and the query cost drops to the HNSW search. The
+    model and dimensions are fixed for the process, so the text alone is a
+    sufficient cache key; the vector is returned as a tuple so cached
+    entries cannot be mutated by callers.
+    """
+    return tuple(get_embedding_function()([text])[0])
+
 
 def get_chroma_client():
     """
@@ -119,27 +170,24 @@ async def chroma_get_collection_info(collection_name: str) -> Dict:
     try:
         collection = client.get_collection(
             collection_name,
-            embedding_function=OpenAIEmbeddingFunction(
-                api_key=os.getenv("OPENAI_API_KEY"),
-                model_name=EMBEDDING_MODEL,
-                dimensions=DIMENSIONS
-            )
+            embedding_function=get_embedding_function()
         )
         logger.info(f"Retrieved collection '{collection_name}'")
         
         # Get collection count
         count = collection.count()
         logger.info(f"Collection '{collection_name}' has {count} documents")
-        
-        # Peek at a few documents
-        peek_results = collection.peek(limit=1)
-        logger.info(f"Retrieved {len(peek_results.get('ids', []))} sample documents")
-        
+
+        # Fetch a single record's metadata; peek would also pull the
+        # document text and the full embedding vector just to read the title
+        sample = collection.get(limit=1, include=["metadatas"])
+        logger.info(f"Retrieved {len(sample.get('ids', []))} sample documents")
+
         result = {
             "name": collection_name,
-            "paper_title": peek_results['metadatas'][0]['paper_title'],
+            "paper_title": sample['metadatas'][0]['paper_title'],
             "count": count,
-            "sample_documents": peek_results
+            "sample_documents": sample
         }
         logger.info(f"Collection info retrieved successfully for '{collection_name}'")
         return result
@@ -181,20 +229,20 @@ async def chroma_query_documents(
         logger.error("Query texts list is empty")
         raise ValueError("The 'query_texts' list cannot be empty.")
 
+    # Only serialize fields Chroma actually supports
+    include = [field for field in include if field in _VALID_INCLUDE]
+
     client = get_chroma_client()
     try:
-        collection = client.get_collection(
-            collection_name,
-            embedding_function=OpenAIEmbeddingFunction(
-                api_key=os.getenv("OPENAI_API_KEY"),
-                model_name=EMBEDDING_MODEL,
-                dimensions=DIMENSIONS
-            )
-        )
+        # Queries are embedded through the LRU cache and passed as vectors,
+        # so the collection's embedding function is never invoked here
+        query_embeddings = [list(_embed_query(text.strip())) for text in query_texts]
+
+        collection = client.get_collection(collection_name)
         logger.info(f"Retrieved collection '{collection_name}' for querying")
-        
+
         results = collection.query(
-            query_texts=query_texts,
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=where,
             where_document=where_document,
@@ -210,6 +258,95 @@ async def chroma_query_documents(
         logger.error(f"Failed to query documents from collection '{collection_name}': {e}")
         raise Exception(f"Failed to query documents from collection '{collection_name}': {str(e)}") from e
     
+@mcp.tool()
+async def chroma_query_documents_multi(
+    collection_names: List[str],
+    query_texts: List[str],
+    n_results: int = 5,
+    where: Dict | None = None,
+    where_document: Dict | None = None,
+    include: List[str] = ["documents", "metadatas", "distances"]
+) -> Dict:
+    """Query several Chroma collections concurrently and merge the best matches.
+
+    The collections are queried in parallel, so the latency is that of one
+    query rather than one per collection, and the top n_results across all
+    collections are returned per query text.
+
+    Args:
+        collection_names: Names of the collections to query
+        query_texts: List of query texts to search for
+        n_results: Number of merged results to return per query
+        where: Optional metadata filters using Chroma's query operators
+        where_document: Optional document content filters
+        include: List of what to include in response. By default, this will include documents, metadatas, and distances.
+
+    Returns:
+        Dictionary with a "queries" list; each entry holds the query text and
+        its merged results, each tagged with the source collection
+    """
+    logger.info(f"Querying {len(collection_names)} collections with {len(query_texts)} queries, n_results={n_results}")
+
+    if not query_texts:
+        logger.error("Query texts list is empty")
+        raise ValueError("The 'query_texts' list cannot be empty.")
+    if not collection_names:
+        logger.error("Collection names list is empty")
+        raise ValueError("The 'collection_names' list cannot be empty.")
+
+    # Only serialize fields Chroma actually supports
+    include = [field for field in include if field in _VALID_INCLUDE]
+
+    client = get_chroma_client()
+    try:
+        # One embedding per query text, shared by every collection
+        query_embeddings = [list(_embed_query(text.strip())) for text in query_texts]
+
+        # Distances are required for the merge even if the caller did not ask
+        merge_include = include if "distances" in include else [*include, "distances"]
+
+        def query_one(name: str):
+            collection = client.get_collection(name)
+            return name, collection.query(
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=where,
+                where_document=where_document,
+                include=merge_include
+            )
+
+        per_collection = await asyncio.gather(
+            *(asyncio.to_thread(query_one, name) for name in collection_names)
+        )
+
+        # Merge each query's candidates across collections, keeping the
+        # n_results with the smallest distances
+        queries = []
+        for query_index, query_text in enumerate(query_texts):
+            candidates = []
+            for name, results in per_collection:
+                for result_index, doc_id in enumerate(results['ids'][query_index]):
+                    record = {
+                        'collection': name,
+                        'id': doc_id,
+                        'distance': results['distances'][query_index][result_index]
+                    }
+                    if results.get('documents'):
+                        record['document'] = results['documents'][query_index][result_index]
+                    if results.get('metadatas'):
+                        record['metadata'] = results['metadatas'][query_index][result_index]
+                    candidates.append(record)
+
+            top = heapq.nsmallest(n_results, candidates, key=lambda record: record['distance'])
+            queries.append({'query': query_text, 'results': top})
+
+        logger.info(f"Multi-collection query completed across {len(collection_names)} collections")
+        return {'queries': queries}
+    except Exception as e:
+        logger.error(f"Failed to query collections {collection_names}: {e}")
+        raise Exception(f"Failed to query collections {collection_names}: {str(e)}") from e
+
+
 @mcp.tool()
 async def chroma_get_documents(
     collection_name: str,
@@ -239,24 +376,23 @@ async def chroma_get_documents(
     Returns:
         Dictionary containing the matching documents, their IDs, and requested includes
     """
-    logger.info(f"Getting documents from collection '{collection_name}'")
+    logger.debug(f"Getting documents from collection '{collection_name}'")
     logger.debug(f"IDs: {ids}")
     logger.debug(f"Where filter: {where}")
     logger.debug(f"Where document filter: {where_document}")
     logger.debug(f"Include: {include}")
     logger.debug(f"Limit: {limit}, Offset: {offset}")
-    
+
+    # Only serialize fields Chroma actually supports
+    include = [field for field in include if field in _VALID_INCLUDE]
+
     client = get_chroma_client()
     try:
         collection = client.get_collection(
             collection_name,
-            embedding_function=OpenAIEmbeddingFunction(
-                api_key=os.getenv("OPENAI_API_KEY"),
-                model_name=EMBEDDING_MODEL,
-                dimensions=DIMENSIONS
-            )
+            embedding_function=get_embedding_function()
         )
-        logger.info(f"Retrieved collection '{collection_name}' for document retrieval")
+        logger.debug(f"Retrieved collection '{collection_name}' for document retrieval")
         
         results = collection.get(
             ids=ids,
@@ -269,7 +405,7 @@ async def chroma_get_documents(
         
         # Log results summary
         total_documents = len(results.get('ids', [])) if results.get('ids') else 0
-        logger.info(f"Retrieved {total_documents} documents from collection '{collection_name}'")
+        logger.debug(f"Retrieved {total_documents} documents from collection '{collection_name}'")
         
         return results
     except Exception as e:
@@ -5,16 +5,30 @@ Builds an ephemeral ChromaDB client and ingests processed JSON files into collec
 """
 
 import os
+import asyncio
+import hashlib
 import json
+import ijson
+import orjson
+import sqlite3
 import sys
 import re
+import string
+import time
 import logging
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
+from openai import AsyncOpenAI, OpenAI
+import numpy as np
+import pandas as pd
 
 try:
     import chromadb
+    from chromadb.api.types import EmbeddingFunction
     from chromadb.config import Settings
     from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
 except ImportError:
@@ -31,27 +45,266 @@ openai_api_key = os.getenv("OPENAI_API_KEY")
 EMBEDDING_MODEL = "text-embedding-3-large"
 DIMENSIONS = 1536
 
+# HNSW index settings applied to newly created collections. Cosine space
+# matches the normalized vectors from compact_embeddings; M/ef trade recall
+# against memory and insert speed and can be tuned per deployment through
+# the environment; batch_size amortizes graph inserts across batched adds.
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": int(os.getenv("CHROMA_HNSW_M", 16)),
+    "hnsw:construction_ef": int(os.getenv("CHROMA_HNSW_EF_CONSTRUCTION", 100)),
+    "hnsw:search_ef": int(os.getenv("CHROMA_HNSW_EF_SEARCH", 64)),
+    "hnsw:batch_size": 1000,
+}
+
+
+def _intern_str(value):
+    """Intern string values; anything else passes through unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class _ReplaceMissing(dict):
+    """Translation table that maps every unlisted character to underscore."""
+
+    def __missing__(self, code):
+        return '_'
+
+
+# Alphanumerics and whitespace pass through; everything else (including
+# non-ASCII) becomes an underscore, all in C without the regex engine
+_NAME_TRANS = _ReplaceMissing(
+    {ord(c): c for c in string.ascii_letters + string.digits + string.whitespace}
+)
+
+# Collapses whitespace/underscore runs into a single underscore
+_NAME_COLLAPSE = re.compile(r'[\s_]+')
+
+
+@lru_cache(maxsize=4096)
+def _collection_name(paper_title: str) -> str:
+    """Compute (and memoize) the collection name for a paper title."""
+    # Replace special characters with underscores
+    name = paper_title.translate(_NAME_TRANS)
+
+    # Replace multiple spaces/underscores with single underscore and
+    # remove leading/trailing underscores
+    name = _NAME_COLLAPSE.sub('_', name).strip('_')
+
+    # Limit length (ChromaDB has limits)
+    if len(name) > 63:
+        name = name[:63]
+
+    # Ensure it starts with a letter
+    if name and not name[0].isalpha():
+        name = 'paper_' + name
+
+    return name.lower()
+
+
+def compact_embeddings(vectors: List[List[float]]) -> List[List[float]]:
+    """
+    L2-normalize embedding vectors and downcast them to float16.
+
+    Halves the per-vector memory and disk footprint in the HNSW index; with
+    cosine space and normalized inputs the recall loss is negligible.
+
+    Args:
+        vectors: Raw float32 embedding vectors
+
+    Returns:
+        Normalized float16 vectors as plain lists
+    """
+    arr = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    np.divide(arr, norms, out=arr, where=norms != 0)
+    return arr.astype(np.float16).tolist()
+
+
+class CachedEmbeddingFunction(EmbeddingFunction):
+    """
+    Wraps an embedding function with an on-disk SQLite cache.
+
+    Vectors are keyed by sha256(model:dimensions:text), so re-ingesting an
+    unchanged corpus makes zero embedding API calls; only texts missing from
+    the cache are forwarded to the wrapped function.
+
+    Subclassing Chroma's EmbeddingFunction protocol (name/get_config/
+    build_from_config) is what lets the wrapper pass the validation that
+    `get_or_create_collection` runs on any embedding function it is given.
+    """
+
+    def __init__(self, embedding_function, cache_path: str):
+        """
+        Args:
+            embedding_function: The embedding function to wrap (called only
+                                for cache misses)
+            cache_path: Path of the SQLite cache database
+        """
+        self._embed = embedding_function
+        self._cache_path = cache_path
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache (key TEXT PRIMARY KEY, vec BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(text: str) -> str:
+        """Cache key for one text under the configured model and dimensions."""
+        return hashlib.sha256(
+            f"{EMBEDDING_MODEL}:{DIMENSIONS}:{text}".encode("utf-8")
+        ).hexdigest()
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in input]
+
+        # Bulk lookup of every key in one query
+        placeholders = ",".join("?" * len(keys))
+        rows = self._conn.execute(
+            f"SELECT key, vec FROM embedding_cache WHERE key IN ({placeholders})",
+            keys
+        ).fetchall()
+        vectors = {key: np.frombuffer(vec, dtype=np.float32).tolist() for key, vec in rows}
+
+        # Embed only the misses (each distinct text once), then persist
+        # them for the next run
+        misses = {}
+        for i, key in enumerate(keys):
+            if key not in vectors and key not in misses:
+                misses[key] = i
+
+        if misses:
+            new_vectors = self._embed([input[i] for i in misses.values()])
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (key, vec) VALUES (?, ?)",
+                [(key, np.asarray(vec, dtype=np.float32).tobytes())
+                 for key, vec in zip(misses, new_vectors)]
+            )
+            self._conn.commit()
+            for key, vec in zip(misses, new_vectors):
+                vectors[key] = list(vec)
+
+        return [vectors[key] for key in keys]
+
+    @staticmethod
+    def name() -> str:
+        """Identifier Chroma records in the collection's configuration."""
+        return "cached_openai"
+
+    def default_space(self) -> str:
+        return "cosine"
+
+    def get_config(self) -> Dict[str, Any]:
+        """Serializable configuration build_from_config can rebuild from."""
+        return {
+            "model_name": EMBEDDING_MODEL,
+            "dimensions": DIMENSIONS,
+            "cache_path": self._cache_path,
+        }
+
+    @staticmethod
+    def build_from_config(config: Dict[str, Any]) -> "CachedEmbeddingFunction":
+        return CachedEmbeddingFunction(
+            OpenAIEmbeddingFunction(
+                api_key=openai_api_key,
+                model_name=config["model_name"],
+                dimensions=config["dimensions"]
+            ),
+            cache_path=config["cache_path"]
+        )
+
 
 class ChromaDocumentIngester:
     """
     A class to handle ChromaDB document ingestion from processed JSON files.
     """
-    
-    def __init__(self, persist_directory: str = "./chroma_db"):
+
+    def __init__(self, persist_directory: str = "./chroma_db",
+                 client_type: str = "persistent",
+                 host: str = "localhost", port: int = 8000,
+                 force_reparse: bool = False):
         """
         Initialize the ChromaDB client.
-        
+
         Args:
             persist_directory: Directory to persist data (None for ephemeral)
+            client_type: "persistent" for in-process SQLite storage, or
+                         "http" to talk to a chroma server (started with
+                         `chroma run --path ./chroma_db`), which moves the
+                         SQLite/HNSW write work into the server process
+            host: Chroma server host (http client only)
+            port: Chroma server port (http client only)
+            force_reparse: Re-ingest files even when the manifest says their
+                           collection is already populated
         """
         self.persist_directory = persist_directory
-        
-        # Persistent client
-        self.client = chromadb.PersistentClient(path=persist_directory)
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Initialized persistent ChromaDB client at: {persist_directory}")
-        
+
+        # Telemetry is disabled so no network ping is added to every call
+        settings = Settings(anonymized_telemetry=False, allow_reset=False)
+
+        if client_type == "persistent":
+            self.client = chromadb.PersistentClient(
+                path=persist_directory,
+                settings=settings
+            )
+            self.logger.info(f"Initialized persistent ChromaDB client at: {persist_directory}")
+        elif client_type == "http":
+            self.client = chromadb.HttpClient(host=host, port=port, settings=settings)
+            self.logger.info(f"Initialized ChromaDB HTTP client for {host}:{port}")
+        else:
+            raise ValueError(f"Unsupported client_type: {client_type}")
+
+        # One cached embedding function shared by every collection, so
+        # unchanged chunks are never re-embedded across runs
+        self.embedding_function = CachedEmbeddingFunction(
+            OpenAIEmbeddingFunction(
+                api_key=openai_api_key,
+                model_name=EMBEDDING_MODEL,
+                dimensions=DIMENSIONS
+            ),
+            cache_path=os.path.join(persist_directory, "embedding_cache.sqlite3")
+        )
+
+        # Manifest of previously ingested files ({filename: title, chunks}),
+        # so re-runs can decide to skip a file without opening it
+        self.force_reparse = force_reparse
+        self._manifest_path = os.path.join(persist_directory, "manifest.json")
+        self._manifest = self._load_manifest()
+
         self.collections = {}
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the ingest manifest from the persist directory."""
+        try:
+            with open(self._manifest_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        """Persist the ingest manifest."""
+        with open(self._manifest_path, 'wb') as f:
+            f.write(orjson.dumps(self._manifest, option=orjson.OPT_INDENT_2))
+
+    def _manifest_skip(self, source_name: str) -> bool:
+        """
+        True when the manifest says this source is already ingested and its
+        collection really holds that many chunks, so the source can be
+        skipped without opening it. Always False under force_reparse.
+        """
+        if self.force_reparse:
+            return False
+        entry = self._manifest.get(source_name.split('/')[-1])
+        if not entry:
+            return False
+        collection = self.create_or_get_collection(entry['paper_title'])
+        if collection.count() >= entry['chunks']:
+            self.logger.info(
+                f"Skipping {source_name}: already ingested ({entry['chunks']} chunks)"
+            )
+            return True
+        return False
     
     def get_collection_name(self, paper_title: str) -> str:
         """
@@ -63,25 +316,9 @@ class ChromaDocumentIngester:
         Returns:
             Valid collection name
         """
-        # Remove special characters and limit length
-        # Replace special characters with underscores
-        name = re.sub(r'[^a-zA-Z0-9\s]', '_', paper_title)
-        
-        # Replace multiple spaces/underscores with single underscore
-        name = re.sub(r'[\s_]+', '_', name)
-        
-        # Remove leading/trailing underscores
-        name = name.strip('_')
-        
-        # Limit length (ChromaDB has limits)
-        if len(name) > 63:
-            name = name[:63]
-        
-        # Ensure it starts with a letter
-        if name and not name[0].isalpha():
-            name = 'paper_' + name
-        
-        return name.lower()
+        # The same titles come up once per ingest and again per query, so
+        # the sanitization is memoized at module level
+        return _collection_name(paper_title)
     
     def create_or_get_collection(self, paper_title: str) -> chromadb.Collection:
         """
@@ -97,24 +334,17 @@ class ChromaDocumentIngester:
         
         if collection_name in self.collections:
             return self.collections[collection_name]
-        
-        try:
-            # Try to get existing collection
-            collection = self.client.get_collection(name=collection_name)
-            self.logger.info(f"Retrieved existing collection: {collection_name}")
-        except:
-            # Create new collection
-            collection = self.client.create_collection(
-                name=collection_name,
-                metadata={"paper_title": paper_title},
-                embedding_function=OpenAIEmbeddingFunction(
-                    api_key=os.getenv("OPENAI_API_KEY"),
-                    model_name=EMBEDDING_MODEL,
-                    dimensions=DIMENSIONS
-                )
-            )
-            self.logger.info(f"Created new collection: {collection_name}")
-        
+
+        # One round-trip whether the collection exists or not, and real
+        # errors (auth, network) propagate instead of being swallowed by
+        # exception-driven control flow
+        collection = self.client.get_or_create_collection(
+            name=collection_name,
+            metadata={"paper_title": paper_title, **HNSW_METADATA},
+            embedding_function=self.embedding_function
+        )
+        self.logger.info(f"Using collection: {collection_name}")
+
         self.collections[collection_name] = collection
         return collection
     
@@ -132,19 +362,21 @@ class ChromaDocumentIngester:
         chunk_id = str(chunk.get('id', ''))
         content = chunk.get('content', '')
         metadata = chunk.get('metadata', {})
-        
-        # Create ChromaDB document
+
+        # The same short strings ("header", tag names, the paper title)
+        # recur in every chunk's metadata; interning them makes each dict
+        # share one object instead of allocating fresh copies
         document = {
             'id': f"{paper_title}_{chunk_id}",
             'document': content,
             'metadata': {
-                'paper_title': paper_title,
+                'paper_title': _intern_str(paper_title),
                 'chunk_id': chunk_id,
-                'content_type': metadata.get('type', 'unknown'),
-                'html_class': metadata.get('html_class', ''),
+                'content_type': _intern_str(metadata.get('type', 'unknown')),
+                'html_class': _intern_str(metadata.get('html_class', '')),
                 'token_count': metadata.get('token_count', 0),
                 'position': metadata.get('position', 0),
-                'tag_name': metadata.get('tag_name', '')
+                'tag_name': _intern_str(metadata.get('tag_name', ''))
             }
         }
         
@@ -162,64 +394,607 @@ class ChromaDocumentIngester:
         
         return document
     
-    def ingest_paper(self, json_file_path: str) -> bool:
+    def process_document_chunks(self, chunks: List[Dict[str, Any]],
+                                paper_title: str) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+        """
+        Vectorized equivalent of process_document_chunk for a whole paper.
+
+        Builds the documents/ids/metadatas columns with pandas instead of a
+        per-chunk Python loop of dict copies and .get() lookups; the
+        type-conditional fields are attached afterwards only on the rows
+        that carry them.
+
+        Args:
+            chunks: The chunk dictionaries from JSON
+            paper_title: The title of the paper
+
+        Returns:
+            (documents, ids, metadatas) ready for collection.add
+        """
+        df = pd.json_normalize(chunks)
+        n = len(df)
+
+        def column(name: str, default) -> pd.Series:
+            """Column with missing values (or a missing column) filled."""
+            if name in df.columns:
+                return df[name].fillna(default)
+            return pd.Series([default] * n, index=df.index)
+
+        chunk_ids = column('id', '').astype(str)
+        ids = (f"{paper_title}_" + chunk_ids).tolist()
+        documents = column('content', '').tolist()
+
+        content_types = column('metadata.type', 'unknown')
+        metadatas = pd.DataFrame({
+            'paper_title': paper_title,
+            'chunk_id': chunk_ids,
+            'content_type': content_types,
+            'html_class': column('metadata.html_class', ''),
+            'token_count': column('metadata.token_count', 0),
+            'position': column('metadata.position', 0),
+            'tag_name': column('metadata.tag_name', ''),
+        }).to_dict(orient='records')
+
+        # Level/list_type/merged_chunks only apply to certain content types
+        for source, target, row_type in (
+            ('metadata.level', 'level', 'header'),
+            ('metadata.list_type', 'list_type', 'list'),
+            ('metadata.merged_chunks', 'merged_chunks', 'table'),
+        ):
+            if source not in df.columns:
+                continue
+            mask = (content_types == row_type) & df[source].notna()
+            for i in np.flatnonzero(mask.to_numpy()):
+                value = df[source].iloc[i]
+                if target in ('level', 'merged_chunks'):
+                    # NaNs in the column force a float dtype; restore ints
+                    value = int(value)
+                metadatas[i][target] = value
+
+        return documents, ids, metadatas
+
+    def ingest_paper(self, json_file_path: str, batch_size: int = 200) -> Tuple[bool, int]:
         """
         Ingest a single paper JSON file into ChromaDB.
-        
+
+        Chunks are streamed off disk with ijson and flushed to the
+        collection in batch_size slices, so memory use stays constant no
+        matter how large the file is.
+
         Args:
             json_file_path: Path to the JSON file
-            
+            batch_size: Number of chunks to accumulate before flushing
+
+        Returns:
+            (success, number of chunks ingested)
+        """
+        try:
+            self.logger.info(f"Processing: {json_file_path}")
+
+            # A manifest hit plus an already-populated collection means the
+            # file can be skipped without even opening it
+            if self._manifest_skip(json_file_path):
+                return True, 0
+
+            # The title comes from the first chunk only, so the full file
+            # never has to be in memory before streaming starts; interned
+            # once here so every chunk's metadata shares the same object
+            paper_title = sys.intern(self._peek_title(json_file_path))
+            self.logger.info(f"Paper: {paper_title}")
+
+            # Create or get collection
+            collection = self.create_or_get_collection(paper_title)
+
+            total = 0
+            documents, ids, metadatas = [], [], []
+
+            def flush():
+                nonlocal documents, ids, metadatas, total
+                collection.add(documents=documents, ids=ids, metadatas=metadatas)
+                total += len(ids)
+                documents, ids, metadatas = [], [], []
+
+            with open(json_file_path, 'rb') as f:
+                for chunk in ijson.items(f, 'item'):
+                    processed_chunk = self.process_document_chunk(chunk, paper_title)
+
+                    documents.append(processed_chunk['document'])
+                    ids.append(str(processed_chunk['id']))
+                    metadatas.append(processed_chunk['metadata'])
+
+                    if len(ids) >= batch_size:
+                        flush()
+
+            if ids:
+                flush()
+
+            if total == 0:
+                self.logger.warning(f"No chunks found in {json_file_path}")
+                return False, 0
+
+            # Record the ingest so the next run can skip this file outright
+            file_name = json_file_path.split('/')[-1]
+            self._manifest[file_name] = {'paper_title': paper_title, 'chunks': total}
+            self._save_manifest()
+
+            self.logger.info(f"Added {total} chunks to collection")
+            return True, total
+
+        except Exception as e:
+            self.logger.error(f"Error processing {json_file_path}: {e}")
+            return False, 0
+
+    def _get_sqlite_connection(self):
+        """
+        Reach into the persistent client's internals to grab the underlying
+        SQLite connection. Returns None if Chroma's internal layout changed.
+        """
+        try:
+            return self.client._server._sysdb._conn_pool.connect()
+        except AttributeError:
+            return None
+
+    @contextmanager
+    def bulk_mode(self):
+        """
+        Context manager that relaxes SQLite durability settings for a
+        one-shot bulk ingest, then restores durable defaults.
+
+        Default journaling/synchronous settings make each `collection.add`
+        fsync-heavy; for a first-time load it is safe to trade crash
+        recovery for much faster inserts (the ingest can simply be re-run).
+        """
+        conn = self._get_sqlite_connection()
+
+        if conn is None:
+            self.logger.warning("Could not access SQLite connection; bulk mode disabled")
+            yield
+            return
+
+        self.logger.info("Entering bulk ingest mode (relaxed SQLite durability)")
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+        try:
+            yield
+        finally:
+            # Restore Chroma's durable defaults
+            conn.execute("PRAGMA locking_mode=NORMAL")
+            conn.execute("PRAGMA temp_store=DEFAULT")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.logger.info("Restored durable SQLite settings")
+
+    def ingest_records_batched(self,
+                               papers: List[Tuple[str, List[Dict[str, Any]]]],
+                               batch_size: int = 200) -> Dict[str, bool]:
+        """
+        Ingest database-format records for multiple papers, batching chunks
+        into large `collection.add` calls instead of one call per paper.
+
+        Chroma insertion cost is dominated by per-call fixed overhead
+        (SQLite transaction, HNSW resize), so accumulating chunks across
+        papers and flushing in batches is substantially faster. Records are
+        passed in memory, so fused pipelines can skip the disk round-trip.
+
+        Args:
+            papers: (source_name, records) pairs; source_name is used as the
+                    paper title fallback and as the key in the result dict
+            batch_size: Number of chunks to accumulate before flushing
+
+        Returns:
+            Dictionary mapping each source_name to True/False for success
+        """
+        results = {}
+
+        # Pending chunks grouped by collection name
+        pending: Dict[str, Dict[str, list]] = {}
+
+        # Manifest entries staged per source, written out once every flush
+        # has gone through so a re-run can skip these sources outright
+        staged_manifest: Dict[str, Dict[str, Any]] = {}
+
+        def flush(collection_name: str):
+            """
+            Flush the pending chunks for one collection in batch_size slices.
+
+            A failed add marks every source that contributed to the bucket
+            as failed (and unstages its manifest entry) instead of
+            propagating, so one bad collection cannot abort the whole
+            ingest or leave its sources falsely reported as successful.
+            """
+            bucket = pending[collection_name]
+            collection = self.collections[collection_name]
+
+            try:
+                for start in range(0, len(bucket['ids']), batch_size):
+                    end = start + batch_size
+                    collection.add(
+                        documents=bucket['documents'][start:end],
+                        ids=bucket['ids'][start:end],
+                        metadatas=bucket['metadatas'][start:end]
+                    )
+            except Exception as e:
+                self.logger.error(f"Error flushing to collection {collection_name}: {e}")
+                for name in bucket['sources']:
+                    results[name] = False
+                    staged_manifest.pop(name.split('/')[-1], None)
+            else:
+                self.logger.info(f"Flushed {len(bucket['ids'])} chunks to collection {collection_name}")
+
+            pending[collection_name] = {'documents': [], 'ids': [], 'metadatas': [], 'sources': []}
+
+        for source_name, chunks in papers:
+            try:
+                self.logger.info(f"Processing: {source_name}")
+
+                if self._manifest_skip(source_name):
+                    results[source_name] = True
+                    continue
+
+                if not chunks:
+                    self.logger.warning(f"No chunks found in {source_name}")
+                    results[source_name] = False
+                    continue
+
+                # Get paper title from first chunk
+                paper_title = chunks[0].get('metadata', {}).get('name', 'Unknown Paper')
+
+                # If unknown paper, use the source name (stripped of any
+                # directory and extension when it is a file path):
+                if paper_title == 'Unknown Paper':
+                    paper_title = source_name.split('/')[-1].split('.')[0]
+
+                collection = self.create_or_get_collection(paper_title)
+                collection_name = self.get_collection_name(paper_title)
+
+                bucket = pending.setdefault(
+                    collection_name,
+                    {'documents': [], 'ids': [], 'metadatas': [], 'sources': []}
+                )
+
+                documents, ids, metadatas = self.process_document_chunks(chunks, paper_title)
+                bucket['documents'].extend(documents)
+                bucket['ids'].extend(ids)
+                bucket['metadatas'].extend(metadatas)
+                bucket['sources'].append(source_name)
+
+                # Provisional until the bucket flushes; a failed flush
+                # downgrades every contributing source, so these must be
+                # staged before the flush below can run
+                staged_manifest[source_name.split('/')[-1]] = {
+                    'paper_title': paper_title,
+                    'chunks': len(chunks)
+                }
+                results[source_name] = True
+
+                # Keep memory bounded: flush once a collection's bucket fills up
+                if len(bucket['ids']) >= batch_size:
+                    flush(collection_name)
+
+            except Exception as e:
+                self.logger.error(f"Error processing {source_name}: {e}")
+                results[source_name] = False
+
+        # Flush whatever is left in each collection's bucket
+        for collection_name, bucket in pending.items():
+            if bucket['ids']:
+                flush(collection_name)
+
+        # Record the ingested sources so the next run can skip them
+        if staged_manifest:
+            self._manifest.update(staged_manifest)
+            self._save_manifest()
+
+        return results
+
+    def ingest_papers_batched(self, json_file_paths: List[str], batch_size: int = 200) -> Dict[str, bool]:
+        """
+        Ingest multiple paper JSON files with batched `collection.add` calls.
+
+        Args:
+            json_file_paths: Paths to the database JSON files to ingest
+            batch_size: Number of chunks to accumulate before flushing
+
+        Returns:
+            Dictionary mapping each file path to True/False for success
+        """
+        results = {}
+        papers = []
+
+        for json_file_path in json_file_paths:
+            try:
+                chunks = self._load_json_file(json_file_path)
+                papers.append((json_file_path, chunks))
+            except Exception as e:
+                self.logger.error(f"Error loading {json_file_path}: {e}")
+                results[json_file_path] = False
+
+        results.update(self.ingest_records_batched(papers, batch_size=batch_size))
+        return results
+
+    def _peek_title(self, json_file_path: str) -> str:
+        """
+        Resolve a file's paper title from its first chunk only.
+
+        Streams just the first JSON object with ijson instead of parsing the
+        whole file, falling back to the file name when the metadata has no
+        usable title.
+        """
+        try:
+            with open(json_file_path, 'rb') as f:
+                first = next(ijson.items(f, 'item'), None)
+            paper_title = (first or {}).get('metadata', {}).get('name', 'Unknown Paper')
+        except Exception as e:
+            self.logger.warning(f"Could not peek title of {json_file_path}: {e}")
+            paper_title = 'Unknown Paper'
+
+        if paper_title == 'Unknown Paper':
+            paper_title = json_file_path.split('/')[-1].split('.')[0]
+
+        return paper_title
+
+    def _load_json_file(self, json_file_path: str) -> List[Dict[str, Any]]:
+        """Load a database JSON file (orjson decodes several times faster
+        than stdlib json)."""
+        with open(json_file_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    async def _embed_texts_async(self, client: AsyncOpenAI, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts with a single AsyncOpenAI request.
+
+        Duplicate texts (repeated headers, footers, boilerplate) are sent
+        once and the vector is fanned back out to every occurrence, cutting
+        billed tokens by the duplicate ratio.
+        """
+        unique_map = defaultdict(list)
+        for index, text in enumerate(texts):
+            unique_map[text].append(index)
+
+        unique_texts = list(unique_map)
+        response = await client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=unique_texts,
+            dimensions=DIMENSIONS
+        )
+
+        vectors: List[List[float]] = [None] * len(texts)
+        for text, item in zip(unique_texts, response.data):
+            for index in unique_map[text]:
+                vectors[index] = item.embedding
+        return vectors
+
+    async def ingest_paper_async(self, json_file_path: str, client: AsyncOpenAI,
+                                 semaphore: asyncio.Semaphore) -> bool:
+        """
+        Ingest a single paper JSON file with embeddings computed up front.
+
+        Embeddings come from AsyncOpenAI rather than Chroma's synchronous
+        embedding function, so several papers' embedding requests can be in
+        flight at once; `collection.add` then receives the precomputed
+        vectors and does no embedding of its own.
+
+        Args:
+            json_file_path: Path to the JSON file
+            client: Shared AsyncOpenAI client
+            semaphore: Bounds how many embedding requests run concurrently
+
         Returns:
             True if successful, False otherwise
         """
         try:
             self.logger.info(f"Processing: {json_file_path}")
-            
-            # Load JSON data
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                chunks = json.load(f)
-            
+
+            chunks = await asyncio.to_thread(self._load_json_file, json_file_path)
+
             if not chunks:
                 self.logger.warning(f"No chunks found in {json_file_path}")
                 return False
-            
+
             # Get paper title from first chunk
             paper_title = chunks[0].get('metadata', {}).get('name', 'Unknown Paper')
-            self.logger.info(f"Paper: {paper_title}")
-            
+
             # If unknown paper, use the file name:
             if paper_title == 'Unknown Paper':
                 paper_title = json_file_path.split('/')[-1].split('.')[0]
-            
-            # Create or get collection
+
             collection = self.create_or_get_collection(paper_title)
-            
-            # Process chunks
-            documents = []
-            ids = []
-            metadatas = []
-            
-            for chunk in chunks:
-                processed_chunk = self.process_document_chunk(chunk, paper_title)
-                
-                documents.append(processed_chunk['document'])
-                ids.append(str(processed_chunk['id']))
-                metadatas.append(processed_chunk['metadata'])
-                            
-            # Add to collection
-            collection.add(
+
+            documents, ids, metadatas = self.process_document_chunks(chunks, paper_title)
+
+            async with semaphore:
+                embeddings = await self._embed_texts_async(client, documents)
+            embeddings = compact_embeddings(embeddings)
+
+            # collection.add does SQLite/HNSW work, so keep it off the loop
+            await asyncio.to_thread(
+                collection.add,
                 documents=documents,
                 ids=ids,
-                metadatas=metadatas
+                metadatas=metadatas,
+                embeddings=embeddings
             )
-            
+
             self.logger.info(f"Added {len(chunks)} chunks to collection")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error processing {json_file_path}: {e}")
             return False
-    
+
+    async def ingest_papers_async(self, json_file_paths: List[str],
+                                  max_concurrent: int = 8) -> Dict[str, bool]:
+        """
+        Ingest multiple paper JSON files with concurrent embedding requests.
+
+        Wall-clock time drops from the sum of per-paper embedding latencies
+        to roughly max(latency) x ceil(N / max_concurrent).
+
+        Args:
+            json_file_paths: Paths to the database JSON files to ingest
+            max_concurrent: Maximum embedding requests in flight at once
+
+        Returns:
+            Dictionary mapping each file path to True/False for success
+        """
+        client = AsyncOpenAI(api_key=openai_api_key)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        outcomes = await asyncio.gather(
+            *(self.ingest_paper_async(path, client, semaphore) for path in json_file_paths)
+        )
+        return dict(zip(json_file_paths, outcomes))
+
+    def _embed_texts_batch_api(self, texts_by_id: Dict[str, str],
+                               poll_interval: float = 30.0) -> Dict[str, List[float]]:
+        """
+        Embed texts through the OpenAI Batch API.
+
+        Batch jobs run at half the interactive price with a 24h completion
+        window, which suits whole-corpus (re)builds where latency does not
+        matter.
+
+        Args:
+            texts_by_id: Mapping of custom_id to the text to embed
+            poll_interval: Seconds to wait between status polls
+
+        Returns:
+            Mapping of custom_id to embedding vector
+        """
+        client = OpenAI(api_key=openai_api_key)
+
+        # One JSONL request line per distinct text; duplicates across ids
+        # share a single request and get the vector fanned back out below
+        unique_map = defaultdict(list)
+        for custom_id, text in texts_by_id.items():
+            unique_map[text].append(custom_id)
+
+        lines = [
+            json.dumps({
+                "custom_id": f"u{index}",
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {
+                    "model": EMBEDDING_MODEL,
+                    "input": text,
+                    "dimensions": DIMENSIONS
+                }
+            })
+            for index, text in enumerate(unique_map)
+        ]
+
+        batch_file = client.files.create(
+            file=("embeddings.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h"
+        )
+        self.logger.info(f"Submitted embedding batch {batch.id} ({len(lines)} requests)")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            self.logger.info(f"Batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Embedding batch {batch.id} ended with status: {batch.status}")
+
+        output = client.files.content(batch.output_file_id).text
+
+        unique_vectors = {}
+        for line in output.splitlines():
+            if not line:
+                continue
+            item = json.loads(line)
+            unique_vectors[item["custom_id"]] = item["response"]["body"]["data"][0]["embedding"]
+
+        # Scatter each unique vector back to every id that shares the text
+        vectors = {}
+        for index, custom_ids in enumerate(unique_map.values()):
+            vector = unique_vectors[f"u{index}"]
+            for custom_id in custom_ids:
+                vectors[custom_id] = vector
+
+        return vectors
+
+    def ingest_papers_batch_api(self, json_file_paths: List[str]) -> Dict[str, bool]:
+        """
+        Ingest papers with all embeddings computed by one Batch API job.
+
+        Every chunk text across every file goes into a single batch job;
+        once the job completes, the vectors are inserted with
+        `collection.add(embeddings=...)` so Chroma does no embedding itself.
+
+        Args:
+            json_file_paths: Paths to the database JSON files to ingest
+
+        Returns:
+            Dictionary mapping each file path to True/False for success
+        """
+        results = {}
+        papers = []
+        texts_by_id = {}
+
+        for json_file_path in json_file_paths:
+            try:
+                chunks = self._load_json_file(json_file_path)
+
+                if not chunks:
+                    self.logger.warning(f"No chunks found in {json_file_path}")
+                    results[json_file_path] = False
+                    continue
+
+                # Get paper title from first chunk
+                paper_title = chunks[0].get('metadata', {}).get('name', 'Unknown Paper')
+
+                # If unknown paper, use the file name:
+                if paper_title == 'Unknown Paper':
+                    paper_title = json_file_path.split('/')[-1].split('.')[0]
+
+                collection = self.create_or_get_collection(paper_title)
+
+                documents, ids, metadatas = self.process_document_chunks(chunks, paper_title)
+
+                texts_by_id.update(zip(ids, documents))
+                papers.append((json_file_path, collection, documents, ids, metadatas))
+
+            except Exception as e:
+                self.logger.error(f"Error loading {json_file_path}: {e}")
+                results[json_file_path] = False
+
+        if not papers:
+            return results
+
+        try:
+            vectors = self._embed_texts_batch_api(texts_by_id)
+        except Exception as e:
+            self.logger.error(f"Batch embedding failed: {e}")
+            for json_file_path, *_ in papers:
+                results[json_file_path] = False
+            return results
+
+        for json_file_path, collection, documents, ids, metadatas in papers:
+            try:
+                collection.add(
+                    documents=documents,
+                    ids=ids,
+                    metadatas=metadatas,
+                    embeddings=compact_embeddings([vectors[chunk_id] for chunk_id in ids])
+                )
+                self.logger.info(f"Added {len(documents)} chunks to collection")
+                results[json_file_path] = True
+            except Exception as e:
+                self.logger.error(f"Error adding {json_file_path}: {e}")
+                results[json_file_path] = False
+
+        return results
+
     def ingest_folder(self, folder_path: str) -> Dict[str, int]:
         """
         Ingest all JSON files from a folder.
@@ -251,23 +1026,44 @@ class ChromaDocumentIngester:
             'failed': 0,
             'total_chunks': 0
         }
-        
-        # Process each file
+
+        # Group files by their target collection first, parsing only each
+        # file's first chunk to resolve the title; every collection then
+        # gets its adds from one concatenated pass instead of one add per
+        # file, and only one group's files are fully loaded at a time
+        groups = defaultdict(list)
         for json_file in json_files:
-            success = self.ingest_paper(str(json_file))
-            
-            if success:
+            path = str(json_file)
+            # Manifest hits are skipped here, before the file is even opened
+            if self._manifest_skip(path):
                 results['successful'] += 1
-                # Count chunks in successful files
+                continue
+            groups[self.get_collection_name(self._peek_title(path))].append(path)
+
+        for collection_name, group_paths in groups.items():
+            papers = []
+            chunk_counts = {}
+
+            for path in group_paths:
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        chunks = json.load(f)
-                    results['total_chunks'] += len(chunks)
-                except:
-                    pass
-            else:
-                results['failed'] += 1
-        
+                    chunks = self._load_json_file(path)
+                    papers.append((path, chunks))
+                    chunk_counts[path] = len(chunks)
+                except Exception as e:
+                    self.logger.error(f"Error loading {path}: {e}")
+                    results['failed'] += 1
+
+            # Batched ingest across the group's files, so embedding requests
+            # carry hundreds of chunks instead of one round-trip per paper
+            file_results = self.ingest_records_batched(papers)
+
+            for path, success in file_results.items():
+                if success:
+                    results['successful'] += 1
+                    results['total_chunks'] += chunk_counts.get(path, 0)
+                else:
+                    results['failed'] += 1
+
         return results
     
     def list_collections(self) -> List[str]:
@@ -352,22 +1148,52 @@ def main():
                        help='List all collections after ingestion')
     parser.add_argument('--search', help='Search query to test after ingestion')
     parser.add_argument('--collection', help='Collection name for search')
-    
+    parser.add_argument('--use-batch-api', action='store_true',
+                       help='Embed via the OpenAI Batch API (half price, up to 24h turnaround)')
+    parser.add_argument('--server-url', metavar='HOST:PORT',
+                       help='Ingest through a running chroma server instead of in-process SQLite')
+    parser.add_argument('--force-reparse', action='store_true',
+                       help='Re-ingest files even if the manifest marks them as done')
+
     args = parser.parse_args()
-    
+
     # Initialize client
-    ingester = ChromaDocumentIngester(persist_directory=args.persist)
-    
+    if args.server_url:
+        host, _, port = args.server_url.partition(':')
+        ingester = ChromaDocumentIngester(
+            persist_directory=args.persist,
+            client_type='http',
+            host=host,
+            port=int(port) if port else 8000,
+            force_reparse=args.force_reparse
+        )
+    else:
+        ingester = ChromaDocumentIngester(
+            persist_directory=args.persist,
+            force_reparse=args.force_reparse
+        )
+
     # Ingest documents
     print("=== ChromaDB Document Ingestion ===\n")
-    results = ingester.ingest_folder(args.folder)
-    
-    # Print results
-    print(f"\n=== Ingestion Results ===")
-    print(f"Total files: {results.get('total_files', 0)}")
-    print(f"Successful: {results.get('successful', 0)}")
-    print(f"Failed: {results.get('failed', 0)}")
-    print(f"Total chunks ingested: {results.get('total_chunks', 0)}")
+
+    if args.use_batch_api:
+        json_files = sorted(str(path) for path in Path(args.folder).glob("*.json"))
+        file_results = ingester.ingest_papers_batch_api(json_files)
+        successful = sum(1 for success in file_results.values() if success)
+
+        print(f"\n=== Ingestion Results (Batch API) ===")
+        print(f"Total files: {len(json_files)}")
+        print(f"Successful: {successful}")
+        print(f"Failed: {len(json_files) - successful}")
+    else:
+        results = ingester.ingest_folder(args.folder)
+
+        # Print results
+        print(f"\n=== Ingestion Results ===")
+        print(f"Total files: {results.get('total_files', 0)}")
+        print(f"Successful: {results.get('successful', 0)}")
+        print(f"Failed: {results.get('failed', 0)}")
+        print(f"Total chunks ingested: {results.get('total_chunks', 0)}")
     
     # List collections if requested
     if args.list_collections:
@@ -7,14 +7,73 @@ Converts parsed HTML chunks from JSON format into database-ready dictionaries.
 import json
 import sys
 import os
+from collections import Counter
 from typing import List, Dict, Any, Optional, Tuple
 import re
+import string
+
+import ijson
+import orjson
+from pathlib import Path
 
 # Add the src directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.html_parser import ContentType
 
+# Precompiled patterns shared across the conversion helpers. These run once
+# per chunk (and per author/metadata pass), so compiling them at import time
+# avoids repeated regex-cache lookups in the hot loops below.
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+# Translation table mapping ASCII punctuation to spaces; str.translate is a
+# single C-level pass, much cheaper than a character-class regex sub.
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in string.punctuation})
+_RE_SPLIT_PARTS = re.compile(r'<br\s*/?>|\n|;')
+_RE_SPLIT_AUTHORS = re.compile(r',\s*|\s+and\s+|\s*&\s*')
+_RE_DOI = re.compile(r'doi:\s*([^\s]+)', re.IGNORECASE)
+
+# Single alternation covering all the author class/id markers, so each
+# attribute string is scanned once instead of once per pattern.
+_AUTHOR_ATTR_RE = re.compile(r'(?:class|id)="(?:authors?|byline|contributors)"', re.IGNORECASE)
+
+# Known author/affiliation markers for the fallback content scan, hoisted to
+# module level and compiled into a single alternation so each chunk's raw
+# content is scanned once with no lowercased copy.
+_HARDCODED_AUTHOR_MARKERS = (
+    'cameron milne', 'yezzi angi lee', 'taylor wilson', 'hector ferronato',
+    'reveal global consulting', 'census bureau', 'fulton, md'
+)
+_AUTHOR_MARKER_RE = re.compile(
+    '|'.join(map(re.escape, _HARDCODED_AUTHOR_MARKERS)), re.IGNORECASE
+)
+_INSTITUTION_WORD_RE = re.compile(
+    r'consulting|bureau|university|institute|laboratory', re.IGNORECASE
+)
+# Wider institution vocabulary used when classifying individual author-line
+# parts; inc/ltd are word-bounded so e.g. 'including' does not match.
+_INST_RE = re.compile(
+    r'university|institute|laboratory|consulting|bureau|company|\binc\b|\bltd\b',
+    re.IGNORECASE
+)
+
+# Shared immutable defaults for the per-chunk conversion path; hoisted so the
+# hot loop does not rebuild them on every call.
+_EMPTY_DICT: Dict[str, Any] = {}
+_TYPE_MAPPING = {
+    'heading': 'header',
+    'paragraph': 'paragraph',
+    'list': 'list',
+    'table': 'table',
+    'image': 'image',
+    'code_block': 'code',
+    'quote': 'quote',
+    'form': 'form',
+    'navigation': 'navigation',
+    'footer': 'footer',
+    'divider': 'divider',
+    'unknown': 'unknown'
+}
+
 
 def count_tokens(text: str) -> int:
     """
@@ -30,15 +89,30 @@ def count_tokens(text: str) -> int:
     if not text or not text.strip():
         return 0
     
-    # Simple tokenization: split on whitespace and punctuation
-    # Remove HTML tags and special characters
-    clean_text = re.sub(r'<[^>]+>', '', text)  # Remove HTML tags
-    clean_text = re.sub(r'[^\w\s]', ' ', clean_text)  # Replace punctuation with spaces
-    
-    # Split on whitespace and filter out empty strings
-    tokens = [token for token in clean_text.split() if token.strip()]
-    
-    return len(tokens)
+    # Simple tokenization: strip HTML tags, map punctuation to spaces via
+    # the translation table, then count whitespace-separated words
+    return len(_RE_HTML_TAG.sub(' ', text).translate(_PUNCT_TABLE).split())
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """
+    Count tokens for a batch of texts in one tight pass.
+
+    Binding the hot helpers to locals keeps the per-text overhead down when
+    converting thousands of chunks at once.
+
+    Args:
+        texts: List of texts to count tokens for
+
+    Returns:
+        List of token counts, one per input text
+    """
+    sub = _RE_HTML_TAG.sub
+    table = _PUNCT_TABLE
+    return [
+        len(sub(' ', text).translate(table).split()) if text and not text.isspace() else 0
+        for text in texts
+    ]
 
 
 def extract_authors_and_institutions(chunks: List[Dict[str, Any]]) -> Tuple[List[str], List[str], str]:
@@ -55,22 +129,17 @@ def extract_authors_and_institutions(chunks: List[Dict[str, Any]]) -> Tuple[List
     institutions = []
     authors_text = ""
     
-    # Common patterns for author sections
-    author_patterns = [
-        r'class="authors?"',
-        r'class="author"',
-        r'class="byline"',
-        r'class="contributors"',
-        r'id="authors?"',
-        r'id="author"'
-    ]
-    
     # Look for author sections by class/id attributes
     for chunk in chunks:
         attributes = chunk.get('attributes', {})
         class_attr = attributes.get('class', '')
         id_attr = attributes.get('id', '')
         
+        # The overwhelmingly common case is neither attribute being set;
+        # bail out before any normalization or scanning
+        if not class_attr and not id_attr:
+            continue
+        
         # Convert attributes to strings if they're not already
         if isinstance(class_attr, list):
             class_attr = ' '.join(class_attr)
@@ -82,14 +151,21 @@ def extract_authors_and_institutions(chunks: List[Dict[str, Any]]) -> Tuple[List
         elif not isinstance(id_attr, str):
             id_attr = str(id_attr)
         
+        # Cheap substring guard first: skip the regex entirely unless the
+        # attributes mention something author-like
+        class_lower = class_attr.lower()
+        id_lower = id_attr.lower()
+        if ('auth' not in class_lower and 'byline' not in class_lower and
+                'contrib' not in class_lower and 'auth' not in id_lower and
+                'byline' not in id_lower and 'contrib' not in id_lower):
+            continue
+        
         # Check if this chunk is likely an author section
-        is_author_section = False
-        for pattern in author_patterns:
-            if re.search(pattern, class_attr, re.IGNORECASE) or re.search(pattern, id_attr, re.IGNORECASE):
-                is_author_section = True
-                break
+        is_author_section = bool(
+            _AUTHOR_ATTR_RE.search(class_attr) or _AUTHOR_ATTR_RE.search(id_attr)
+        )
         
-        if is_author_section or 'author' in class_attr.lower():
+        if is_author_section or 'author' in class_lower:
             content = chunk.get('content', '')
             if content:
                 authors_text = content
@@ -104,18 +180,15 @@ def extract_authors_and_institutions(chunks: List[Dict[str, Any]]) -> Tuple[List
                 continue
             
             # Look for patterns that indicate author information
-            if any(pattern in content.lower() for pattern in [
-                'cameron milne', 'yezzi angi lee', 'taylor wilson', 'hector ferronato',
-                'reveal global consulting', 'census bureau', 'fulton, md'
-            ]):
+            if _AUTHOR_MARKER_RE.search(content):
                 authors_text = content
                 authors, institutions = parse_authors_and_institutions(content)
                 break
             
             # Look for patterns with commas and institutions
-            if ',' in content and any(word in content.lower() for word in ['consulting', 'bureau', 'university', 'institute', 'laboratory']):
+            if ',' in content and _INSTITUTION_WORD_RE.search(content):
                 # Check if this looks like author info (multiple names, institutions)
-                if len(content.split(',')) >= 3:  # Likely author info
+                if content.count(',') >= 2:  # Likely author info
                     authors_text = content
                     authors, institutions = parse_authors_and_institutions(content)
                     break
@@ -137,7 +210,7 @@ def parse_authors_and_institutions(text: str) -> Tuple[List[str], List[str]]:
     institutions = []
     
     # Clean the text
-    text = re.sub(r'<[^>]+>', '', text)  # Remove HTML tags
+    text = _RE_HTML_TAG.sub('', text)  # Remove HTML tags
     text = text.strip()
     
     # Common patterns for separating authors and institutions
@@ -146,7 +219,7 @@ def parse_authors_and_institutions(text: str) -> Tuple[List[str], List[str]]:
     # Pattern 3: Authors\nInstitution
     
     # Split by common separators
-    parts = re.split(r'<br\s*/?>|\n|;', text)
+    parts = _RE_SPLIT_PARTS.split(text)
     
     if len(parts) >= 2:
         # First part likely contains authors
@@ -155,7 +228,7 @@ def parse_authors_and_institutions(text: str) -> Tuple[List[str], List[str]]:
         institution_part = parts[1].strip()
         
         # Extract authors (split by commas, 'and', '&')
-        author_names = re.split(r',\s*|\s+and\s+|\s*&\s*', author_part)
+        author_names = _RE_SPLIT_AUTHORS.split(author_part)
         authors = [name.strip() for name in author_names if name.strip()]
         
         # Extract institutions
@@ -164,7 +237,7 @@ def parse_authors_and_institutions(text: str) -> Tuple[List[str], List[str]]:
         # Check for additional institutions in remaining parts
         for part in parts[2:]:
             part = part.strip()
-            if part and any(word in part.lower() for word in ['university', 'institute', 'laboratory', 'consulting', 'bureau', 'company', 'inc', 'ltd']):
+            if part and _INST_RE.search(part):
                 institutions.append(part)
     
     else:
@@ -179,7 +252,7 @@ def parse_authors_and_institutions(text: str) -> Tuple[List[str], List[str]]:
                 author_part = ','.join(parts[:-1]).strip()
                 
                 # Extract authors
-                author_names = re.split(r',\s*|\s+and\s+|\s*&\s*', author_part)
+                author_names = _RE_SPLIT_AUTHORS.split(author_part)
                 authors = [name.strip() for name in author_names if name.strip()]
                 
                 # Extract institutions
@@ -221,18 +294,23 @@ def extract_paper_metadata(chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not isinstance(content, str):
             content = str(content) if content is not None else ""
         
-        # Extract abstract
-        if content_type == 'paragraph' and 'abstract' in content.lower()[:50]:
+        # Lowercase once per chunk and reuse; each .lower() call would
+        # allocate a fresh copy of the whole content string
+        content_lower = content.lower()
+        
+        # Extract abstract (slice before lowercasing so we only allocate
+        # the prefix, not the whole content)
+        if content_type == 'paragraph' and 'abstract' in content[:50].lower():
             abstract = content
         
         # Extract keywords
-        if 'keywords' in content.lower() and ':' in content:
-            keyword_part = content.split(':', 1)[1] if ':' in content else content
+        if ':' in content and 'keywords' in content_lower:
+            keyword_part = content.split(':', 1)[1]
             keywords = [kw.strip() for kw in keyword_part.split(',') if kw.strip()]
         
         # Extract DOI
-        if 'doi:' in content.lower():
-            doi_match = re.search(r'doi:\s*([^\s]+)', content, re.IGNORECASE)
+        if 'doi:' in content_lower:
+            doi_match = _RE_DOI.search(content)
             if doi_match:
                 doi = doi_match.group(1)
     
@@ -258,39 +336,48 @@ def extract_paper_title(chunks: List[Dict[str, Any]]) -> str:
     Returns:
         Paper title as string
     """
-    # First, try to find an h1 heading
-    for chunk in chunks:
-        if (chunk.get('content_type') == 'heading' and 
-            chunk.get('level') == 1 and 
-            chunk.get('content')):
-            return chunk['content'].strip()
+    # Single pass: return immediately on an h1, otherwise remember the
+    # first heading and first non-empty content as fallbacks
+    first_heading = None
+    first_content = None
     
-    # Fallback: look for any heading
     for chunk in chunks:
-        if (chunk.get('content_type') == 'heading' and 
-            chunk.get('content')):
-            return chunk['content'].strip()
+        content = chunk.get('content')
+        if not content:
+            continue
+        
+        if chunk.get('content_type') == 'heading':
+            if chunk.get('level') == 1:
+                return content.strip()
+            if first_heading is None:
+                first_heading = content
+        elif first_content is None and content.strip():
+            first_content = content
     
-    # Final fallback: use first non-empty content
-    for chunk in chunks:
-        if chunk.get('content') and chunk['content'].strip():
-            return chunk['content'].strip()[:100] + "..."  # Truncate if too long
+    if first_heading is not None:
+        return first_heading.strip()
+    
+    if first_content is not None:
+        return first_content.strip()[:100] + "..."  # Truncate if too long
     
     return "Untitled Paper"
 
 
 def convert_chunk_to_database_format(
     chunk: Dict[str, Any], 
-    paper_metadata: Dict[str, Any], 
-    chunk_id: int
+    paper_title: str, 
+    chunk_id: int,
+    token_count: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Convert a single chunk to database format.
     
     Args:
         chunk: The chunk dictionary from JSON
-        paper_metadata: Dictionary with paper metadata (title, authors, institutions, etc.)
+        paper_title: Title of the paper the chunk belongs to
         chunk_id: The ID for this chunk
+        token_count: Precomputed token count for the chunk content; computed
+            on the fly when not provided
         
     Returns:
         Database-ready dictionary
@@ -299,39 +386,24 @@ def convert_chunk_to_database_format(
     
     # Determine the type based on content_type
     content_type = chunk.get('content_type', 'unknown')
-    type_mapping = {
-        'heading': 'header',
-        'paragraph': 'paragraph',
-        'list': 'list',
-        'table': 'table',
-        'image': 'image',
-        'code_block': 'code',
-        'quote': 'quote',
-        'form': 'form',
-        'navigation': 'navigation',
-        'footer': 'footer',
-        'divider': 'divider',
-        'unknown': 'unknown'
-    }
-    
-    chunk_type = type_mapping.get(content_type, 'unknown')
+    chunk_type = _TYPE_MAPPING.get(content_type, 'unknown')
     
     # Build metadata - ChromaDB compatible (only primitive types)
     # Extract html_class from attributes.class if available
     html_class = ''
-    if chunk.get('attributes', {}).get('class'):
+    class_value = (chunk.get('attributes') or _EMPTY_DICT).get('class')
+    if class_value:
         # If class is a list, join it; if it's a string, use as is
-        class_value = chunk['attributes']['class']
         if isinstance(class_value, list):
             html_class = ' '.join(class_value)
         else:
             html_class = str(class_value)
     
     metadata = {
-        'name': paper_metadata['title'],
+        'name': paper_title,
         'type': chunk_type,
         'html_class': html_class,
-        'token_count': count_tokens(content),
+        'token_count': count_tokens(content) if token_count is None else token_count,
         'tag_name': chunk.get('tag_name', ''),
         'position': chunk.get('position', 0)
     }
@@ -359,73 +431,67 @@ def convert_chunk_to_database_format(
     }
 
 
-def merge_consecutive_table_chunks(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def merge_consecutive_table_chunks(chunks: List[Dict[str, Any]]):
     """
     Merge consecutive chunks with content_type 'table' into a single chunk.
     
+    Yields chunks lazily so callers can keep streaming; runs of table chunks
+    are collapsed into one merged chunk without building intermediate lists.
+    
     Args:
         chunks: List of chunk dictionaries
         
-    Returns:
-        List of chunks with consecutive table chunks merged
+    Yields:
+        Chunk dictionaries with consecutive table chunks merged
     """
-    if not chunks:
-        return chunks
-    
-    merged_chunks = []
     i = 0
+    n = len(chunks)
     
-    while i < len(chunks):
+    while i < n:
         current_chunk = chunks[i]
-        current_type = current_chunk.get('content_type', '')
         
         # If this is a table chunk, look for consecutive table chunks
-        if current_type == 'table':
-            table_chunks = [current_chunk]
-            table_contents = [current_chunk.get('content', '').strip()]
-            table_attributes = current_chunk.get('attributes', {})
-            table_tag_name = current_chunk.get('tag_name', '')
-            table_position = current_chunk.get('position', 0)
+        if current_chunk.get('content_type', '') == 'table':
+            parts = []
+            content = current_chunk.get('content', '').strip()
+            if content:
+                parts.append(content)
+            count = 1
             
             # Look ahead for consecutive table chunks
             j = i + 1
-            while j < len(chunks) and chunks[j].get('content_type', '') == 'table':
-                table_chunks.append(chunks[j])
-                table_contents.append(chunks[j].get('content', '').strip())
+            while j < n and chunks[j].get('content_type', '') == 'table':
+                content = chunks[j].get('content', '').strip()
+                if content:
+                    parts.append(content)
+                count += 1
                 j += 1
             
             # Merge the table chunks
-            if len(table_chunks) > 1:
-                # Combine content with separators
-                merged_content = ' | '.join([content for content in table_contents if content])
-                
-                # Create merged chunk
-                merged_chunk = {
+            if count > 1:
+                # original_positions is deliberately omitted: the database
+                # converter strips it anyway (ChromaDB rejects list values)
+                yield {
                     'content_type': 'table',
-                    'content': merged_content,
-                    'tag_name': table_tag_name,
-                    'attributes': table_attributes,
-                    'position': table_position,
+                    'content': ' | '.join(parts),
+                    'tag_name': current_chunk.get('tag_name', ''),
+                    'attributes': current_chunk.get('attributes', {}),
+                    'position': current_chunk.get('position', 0),
                     'table_info': {
-                        'merged_chunks': len(table_chunks),
-                        'original_positions': [chunk.get('position', 0) for chunk in table_chunks]
+                        'merged_chunks': count
                     }
                 }
-                
-                merged_chunks.append(merged_chunk)
-                print(f"Merged {len(table_chunks)} consecutive table chunks into one")
+                print(f"Merged {count} consecutive table chunks into one")
             else:
                 # Single table chunk, keep as is
-                merged_chunks.append(current_chunk)
+                yield current_chunk
             
             # Skip the chunks we've processed
             i = j
         else:
             # Non-table chunk, keep as is
-            merged_chunks.append(current_chunk)
+            yield current_chunk
             i += 1
-    
-    return merged_chunks
 
 
 def filter_empty_content(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -438,54 +504,34 @@ def filter_empty_content(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         Filtered list of chunks
     """
-    filtered_chunks = []
-    
-    for chunk in chunks:
-        content = chunk.get('content', '').strip()
-        
-        # Keep chunks with actual content
-        if content:
-            # Also keep structural elements like dividers even if they have minimal content
-            if (chunk.get('content_type') == 'divider' or 
-                chunk.get('content_type') == 'image' or
-                len(content) > 0):
-                filtered_chunks.append(chunk)
-    
-    return filtered_chunks
+    # A chunk survives iff its content has any non-whitespace character;
+    # the tight comprehension keeps this a single C-level loop
+    return [
+        chunk for chunk in chunks
+        if (content := chunk.get('content', '')) and not content.isspace()
+    ]
 
 
-def convert_json_to_database_format(
-    input_file: str, 
-    output_file: Optional[str] = None,
+def convert_chunks_to_database_records(
+    chunks: List[Dict[str, Any]],
     include_empty: bool = False,
     merge_tables: bool = True
 ) -> List[Dict[str, Any]]:
     """
-    Convert JSON file of parsed HTML chunks to database format.
-    
+    Convert already-parsed HTML chunks to database format in memory.
+
+    This is the core of the JSON-to-database stage without any file I/O,
+    so callers can fuse parsing and conversion without round-tripping
+    through disk.
+
     Args:
-        input_file: Path to input JSON file
-        output_file: Path to output JSON file (optional)
+        chunks: List of chunk dictionaries (as produced by the HTML parser)
         include_empty: Whether to include chunks with empty content
-        
+        merge_tables: Whether to merge consecutive table chunks
+
     Returns:
         List of database-ready dictionaries
     """
-    print(f"Loading chunks from: {input_file}")
-    
-    # Load the JSON file
-    try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            chunks = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: File {input_file} not found.")
-        return []
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in {input_file}: {e}")
-        return []
-    
-    print(f"Loaded {len(chunks)} chunks")
-    
     # Extract comprehensive paper metadata
     try:
         paper_metadata = extract_paper_metadata(chunks)
@@ -520,23 +566,34 @@ def convert_json_to_database_format(
         chunks = filter_empty_content(chunks)
         print(f"Filtered out {original_count - len(chunks)} empty chunks")
     
-    # Merge consecutive table chunks
+    # Merge consecutive table chunks, tallying both table counts while the
+    # merged list is materialized instead of making two extra full passes.
+    # Each merged chunk records how many originals it absorbed, so the
+    # pre-merge count can be recovered from the output.
     if merge_tables:
-        original_table_count = sum(1 for chunk in chunks if chunk.get('content_type') == 'table')
-        chunks = merge_consecutive_table_chunks(chunks)
-        final_table_count = sum(1 for chunk in chunks if chunk.get('content_type') == 'table')
+        original_table_count = 0
+        final_table_count = 0
+        merged = []
+        for chunk in merge_consecutive_table_chunks(chunks):
+            merged.append(chunk)
+            if chunk.get('content_type') == 'table':
+                final_table_count += 1
+                original_table_count += chunk.get('table_info', {}).get('merged_chunks', 1)
+        chunks = merged
         if original_table_count != final_table_count:
             print(f"Table merging: {original_table_count} table chunks → {final_table_count} table chunks")
     else:
         print("Table merging disabled")
     
-    # Convert chunks to database format
+    # Convert chunks to database format, precomputing token counts in one
+    # batched pass over the content
+    token_counts = count_tokens_batch([chunk.get('content', '').strip() for chunk in chunks])
     database_chunks = []
     chunk_id = 1
     
-    for chunk in chunks:
+    for chunk, token_count in zip(chunks, token_counts):
         try:
-            db_chunk = convert_chunk_to_database_format(chunk, paper_metadata, chunk_id)
+            db_chunk = convert_chunk_to_database_format(chunk, paper_title, chunk_id, token_count)
             database_chunks.append(db_chunk)
             chunk_id += 1
         except Exception as e:
@@ -545,20 +602,67 @@ def convert_json_to_database_format(
             continue
     
     print(f"Converted {len(database_chunks)} chunks to database format")
-    
+
+    return database_chunks
+
+
+def convert_json_to_database_format(
+    input_file: str,
+    output_file: Optional[str] = None,
+    include_empty: bool = False,
+    merge_tables: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Convert JSON file of parsed HTML chunks to database format.
+
+    Args:
+        input_file: Path to input JSON file
+        output_file: Path to output JSON file (optional)
+        include_empty: Whether to include chunks with empty content
+
+    Returns:
+        List of database-ready dictionaries
+    """
+    print(f"Loading chunks from: {input_file}")
+
+    # Stream-parse the JSON file so chunks are materialized one at a time
+    # instead of building the whole document tree up front. The list itself
+    # is still needed because metadata extraction makes multiple passes.
+    try:
+        with open(input_file, 'rb', buffering=1 << 16) as f:
+            chunks = list(ijson.items(f, 'item'))
+    except FileNotFoundError:
+        print(f"Error: File {input_file} not found.")
+        return []
+    except ijson.JSONError as e:
+        print(f"Error: Invalid JSON in {input_file}: {e}")
+        return []
+
+    print(f"Loaded {len(chunks)} chunks")
+
+    database_chunks = convert_chunks_to_database_records(
+        chunks,
+        include_empty=include_empty,
+        merge_tables=merge_tables
+    )
+
     # Save to output file if specified
     if output_file:
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(database_chunks, f, indent=2, ensure_ascii=False)
-            
+            out_path = Path(output_file)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a sibling temp file and atomically swap it in, so a
+            # crash mid-write (or a concurrent run) never leaves a truncated
+            # database file behind
+            tmp_path = out_path.with_suffix(out_path.suffix + '.tmp')
+            tmp_path.write_bytes(orjson.dumps(database_chunks, option=orjson.OPT_INDENT_2))
+            tmp_path.replace(out_path)
+
             print(f"Saved database format to: {output_file}")
         except Exception as e:
             print(f"Error saving to {output_file}: {e}")
-    
+
     return database_chunks
 
 
@@ -576,14 +680,9 @@ def print_database_summary(database_chunks: List[Dict[str, Any]]):
     print("\n=== Database Format Summary ===")
     print(f"Total chunks: {len(database_chunks)}")
     
-    # Count by type
-    type_counts = {}
-    total_tokens = 0
-    
-    for chunk in database_chunks:
-        chunk_type = chunk['metadata']['type']
-        type_counts[chunk_type] = type_counts.get(chunk_type, 0) + 1
-        total_tokens += chunk['metadata']['token_count']
+    # Count by type and total tokens, both iterating at C speed
+    type_counts = Counter(chunk['metadata']['type'] for chunk in database_chunks)
+    total_tokens = sum(chunk['metadata']['token_count'] for chunk in database_chunks)
     
     print(f"Total tokens: {total_tokens}")
     print("\nChunks by type:")
@@ -1,47 +1,94 @@
+import asyncio
 from google import genai
 from dotenv import load_dotenv
 import os
 from pathlib import Path
+from typing import List
 
 # Load environment variables
 load_dotenv()
 
 client = genai.Client()
 
+PROMPT = "Parse this PDF document into clean HTML format. Preserve the structure, headings, paragraphs, lists, and tables. Use semantic HTML tags like <h1>, <h2>, <p>, <ul>, <ol>, <table>, etc. Do not include any styling or CSS."
+
+HTML_DIR = Path("documents/processed/HTML")
+
+
+def _html_output_path(document_path: str) -> Path:
+    """Build the HTML output path for a PDF, creating the directory."""
+    file_name = document_path.split("/")[-1]
+    HTML_DIR.mkdir(parents=True, exist_ok=True)
+    return HTML_DIR / f"{file_name}.html"
+
+
 def generate_html_from_pdf(document_path: str):
     """
     Convert PDF to HTML using Gemini AI.
-    
+
     Args:
         document_path: Path to the PDF file
     """
-    prompt = "Parse this PDF document into clean HTML format. Preserve the structure, headings, paragraphs, lists, and tables. Use semantic HTML tags like <h1>, <h2>, <p>, <ul>, <ol>, <table>, etc. Do not include any styling or CSS."
-    
     # Upload the file to the client
     file_path = Path(document_path)
     file = client.files.upload(file=file_path)
-    
+
     # Generate content with the PDF file
     response = client.models.generate_content(
         model="gemini-2.5-flash",
-        contents=[file, prompt]
+        contents=[file, PROMPT]
     )
 
-    try:
-        # Extract filename without extension
-        file_name = Path(document_path).stem
-    except Exception as e:
-        print(f"Error extracting filename: {e}")
-        # Use the document path as the file name
-    file_name = document_path.split("/")[-1]
-    
-    # Ensure the HTML output directory exists
-    html_dir = Path("documents/processed/HTML")
-    html_dir.mkdir(parents=True, exist_ok=True)
-
     # Save the HTML output
-    html_path = html_dir / f"{file_name}.html"
+    html_path = _html_output_path(document_path)
     with open(html_path, "w", encoding="utf-8") as f:
         f.write(response.text)
-    
-    print(f"Generated HTML from {document_path} -> {html_path}")
\ No newline at end of file
+
+    print(f"Generated HTML from {document_path} -> {html_path}")
+
+
+async def generate_html_from_pdf_async(document_path: str):
+    """
+    Async variant of generate_html_from_pdf using the client's aio surface,
+    so multiple PDFs can be uploaded and generated concurrently.
+
+    Args:
+        document_path: Path to the PDF file
+    """
+    file_path = Path(document_path)
+    file = await client.aio.files.upload(file=file_path)
+
+    response = await client.aio.models.generate_content(
+        model="gemini-2.5-flash",
+        contents=[file, PROMPT]
+    )
+
+    html_path = _html_output_path(document_path)
+    # Write off the event loop so a slow disk doesn't stall other requests
+    await asyncio.to_thread(html_path.write_text, response.text, encoding="utf-8")
+
+    print(f"Generated HTML from {document_path} -> {html_path}")
+
+
+async def generate_html_batch(document_paths: List[str], max_concurrent: int = 4):
+    """
+    Convert a batch of PDFs concurrently. Wall time approaches the slowest
+    single conversion instead of the sum, bounded by the API's rate limits.
+
+    Args:
+        document_paths: Paths to the PDF files
+        max_concurrent: Maximum number of in-flight conversions
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def convert(path: str):
+        async with semaphore:
+            await generate_html_from_pdf_async(path)
+
+    results = await asyncio.gather(
+        *(convert(path) for path in document_paths),
+        return_exceptions=True
+    )
+    for path, result in zip(document_paths, results):
+        if isinstance(result, Exception):
+            print(f"Error generating HTML from {path}: {result}")
@@ -1,12 +1,35 @@
+import os
 import re
+import sys
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+
+import numpy as np
+import orjson
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
-from bs4 import BeautifulSoup, Tag, NavigableString
+from dataclasses import dataclass
+from enum import StrEnum
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString
+
+# Prefer lxml's C parser when available; fall back to the pure-Python
+# backend so the parser still works without the optional speedup
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# Matches HTML wrapped in a Markdown code fence (as returned by the LLM);
+# group 1 captures the document body in one pass.
+_FENCE_RE = re.compile(r'\A\s*```(?:html)?\s*(.*?)\s*```\s*\Z', re.DOTALL)
 
+class ContentType(StrEnum):
+    """Enumeration of different content types that can be extracted from HTML.
 
-class ContentType(Enum):
-    """Enumeration of different content types that can be extracted from HTML."""
+    As a StrEnum, each member is its string value, so serialization and
+    comparisons need no .value dereference.
+    """
     HEADING = "heading"
     PARAGRAPH = "paragraph"
     LIST = "list"
@@ -23,13 +46,21 @@ class ContentType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Field order for ContentChunk serialization; shared by to_dict so the dict
+# is built with one zip instead of eight literal key writes.
+_CHUNK_KEYS = (
+    'content_type', 'content', 'tag_name', 'attributes',
+    'level', 'list_type', 'table_info', 'position'
+)
+
+
+@dataclass(slots=True)
 class ContentChunk:
     """Represents a chunk of content with its type and metadata."""
     content_type: ContentType
     content: str
     tag_name: str
-    attributes: Dict[str, str]
+    attributes: Optional[Dict[str, str]]  # None when the tag had no attributes
     level: Optional[int] = None  # For headings (h1=1, h2=2, etc.)
     list_type: Optional[str] = None  # For lists (ul, ol)
     table_info: Optional[Dict[str, Any]] = None  # For tables
@@ -37,20 +68,91 @@ class ContentChunk:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the ContentChunk to a JSON-serializable dictionary."""
-        return {
-            'content_type': self.content_type.value,
-            'content': self.content,
-            'tag_name': self.tag_name,
-            'attributes': self.attributes,
-            'level': self.level,
-            'list_type': self.list_type,
-            'table_info': self.table_info,
-            'position': self.position
-        }
+        return dict(zip(_CHUNK_KEYS, (
+            str(self.content_type),
+            self.content,
+            self.tag_name,
+            self.attributes or {},
+            self.level,
+            self.list_type,
+            self.table_info,
+            self.position
+        )))
     
     def __repr__(self) -> str:
         """String representation of the ContentChunk."""
-        return f"ContentChunk(type={self.content_type.value}, tag={self.tag_name}, content='{self.content[:50]}{'...' if len(self.content) > 50 else ''}')"
+        return f"ContentChunk(type={self.content_type}, tag={self.tag_name}, content='{self.content[:50]}{'...' if len(self.content) > 50 else ''}')"
+
+
+# Ordinal layout for ContentType used by ChunkTable's packed type column
+_CONTENT_TYPES = tuple(ContentType)
+_CONTENT_TYPE_ORDINALS = {ct: i for i, ct in enumerate(_CONTENT_TYPES)}
+
+
+class ChunkTable:
+    """
+    Struct-of-arrays view over a parsed chunk list.
+
+    Large documents produce tens of thousands of ContentChunk objects;
+    filtering or summarizing them chases a pointer per attribute access.
+    Packing the type, level, and position columns into NumPy arrays turns
+    per-type selection into a vectorized mask and the summary into a single
+    np.unique call, while string and dict columns stay as plain lists.
+    """
+
+    __slots__ = (
+        'content_type', 'content', 'tag_name', 'attributes',
+        'level', 'list_type', 'table_info', 'position'
+    )
+
+    def __init__(self, chunks: List['ContentChunk']):
+        self.content_type = np.fromiter(
+            (_CONTENT_TYPE_ORDINALS[chunk.content_type] for chunk in chunks),
+            dtype=np.int8, count=len(chunks)
+        )
+        self.level = np.fromiter(
+            ((chunk.level if chunk.level is not None else -1) for chunk in chunks),
+            dtype=np.int8, count=len(chunks)
+        )
+        self.position = np.fromiter(
+            ((chunk.position if chunk.position is not None else -1) for chunk in chunks),
+            dtype=np.int32, count=len(chunks)
+        )
+        self.content = [chunk.content for chunk in chunks]
+        self.tag_name = [chunk.tag_name for chunk in chunks]
+        self.attributes = [chunk.attributes for chunk in chunks]
+        self.list_type = [chunk.list_type for chunk in chunks]
+        self.table_info = [chunk.table_info for chunk in chunks]
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    def __getitem__(self, index: int) -> 'ContentChunk':
+        """Materialize a ContentChunk for a single row on demand."""
+        level = int(self.level[index])
+        position = int(self.position[index])
+        return ContentChunk(
+            content_type=_CONTENT_TYPES[self.content_type[index]],
+            content=self.content[index],
+            tag_name=self.tag_name[index],
+            attributes=self.attributes[index],
+            level=level if level >= 0 else None,
+            list_type=self.list_type[index],
+            table_info=self.table_info[index],
+            position=position if position >= 0 else None
+        )
+
+    def indices_by_type(self, content_type: ContentType) -> np.ndarray:
+        """Row indices of every chunk with the given content type."""
+        return np.nonzero(self.content_type == _CONTENT_TYPE_ORDINALS[content_type])[0]
+
+    def summary(self) -> Dict[str, int]:
+        """Chunk counts per content type, computed in one vectorized pass."""
+        ordinals, counts = np.unique(self.content_type, return_counts=True)
+        return {
+            _CONTENT_TYPES[ordinal].value: int(count)
+            for ordinal, count in zip(ordinals, counts)
+        }
 
 
 class HTMLContentParser:
@@ -59,7 +161,10 @@ class HTMLContentParser:
     Each chunk represents a logical unit of content like a paragraph, heading, list, etc.
     """
     
-    def __init__(self):
+    def __init__(self, parser: str = DEFAULT_PARSER):
+        # BeautifulSoup backend to parse with ('lxml', 'html.parser', ...)
+        self.parser = parser
+        
         # Tags that represent different content types
         self.heading_tags = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
         self.paragraph_tags = {'p'}
@@ -82,6 +187,40 @@ class HTMLContentParser:
         
         # Tags that might contain content but are usually structural
         self.structural_tags = {'div', 'section', 'article', 'aside', 'main'}
+        
+        # Single dispatch table mapping tag name to handler; one dict hit
+        # replaces the 13-way membership chain per element. Ignored tags map
+        # to None and win over the structural handlers (div etc. appear in
+        # both sets), matching the old check order.
+        self._dispatch = {}
+        for handler, tag_set in (
+            (self._process_heading, self.heading_tags),
+            (self._process_paragraph, self.paragraph_tags),
+            (self._process_list, self.list_tags),
+            (self._process_table, self.table_tags),
+            (self._process_divider, self.divider_tags),
+            (self._process_image, self.image_tags),
+            (self._process_code, self.code_tags),
+            (self._process_quote, self.quote_tags),
+            (self._process_form, self.form_tags),
+            (self._process_navigation, self.nav_tags),
+            (self._process_footer, self.footer_tags),
+            (self._process_header, self.header_tags),
+            (self._process_structural, self.structural_tags),
+        ):
+            for tag in tag_set:
+                self._dispatch[tag] = handler
+        for tag in self.ignore_tags:
+            self._dispatch[tag] = None
+        
+        # Skip ignored tags (script/style/head and bare structural
+        # wrappers) at parse time instead of building and discarding them.
+        # This is an exclude list rather than an allow list on purpose:
+        # content-bearing tags outside the known sets (figure, figcaption,
+        # dl, ...) must still materialize so _process_unknown can chunk
+        # their text, as it always has.
+        ignore_tags = self.ignore_tags
+        self._strainer = SoupStrainer(lambda name: name not in ignore_tags)
     
     def parse_html(self, html_string: str) -> List[ContentChunk]:
         """
@@ -93,81 +232,72 @@ class HTMLContentParser:
         Returns:
             List of ContentChunk objects representing different content types
         """
+        return list(self.iter_chunks(html_string))
+    
+    def iter_chunks(self, html_string: str):
+        """
+        Lazily yield content chunks from an HTML string.
+        
+        Streaming counterpart of parse_html: callers that filter or write
+        chunks straight to disk never hold the full list in memory.
+        
+        Args:
+            html_string: The HTML string to parse
+            
+        Yields:
+            ContentChunk objects in document order
+        """
         # Clean the HTML string
         html_string = self._clean_html_string(html_string)
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(html_string, 'html.parser')
+        # Parse with BeautifulSoup on the configured backend; lxml's C
+        # parser is several times faster than html.parser on real-world
+        # documents (its html/body wrapper tags fall under ignore_tags)
+        soup = BeautifulSoup(html_string, self.parser, parse_only=self._strainer)
         
-        # Extract chunks
-        chunks = []
+        # Walking the lazy descendants generator avoids find_all(True)
+        # materializing a list of every tag up front; locals keep the type
+        # check and dispatch out of the global/attribute lookup path
         position = 0
-        
-        for element in soup.find_all(True):
-            chunk = self._process_element(element, position)
+        tag_type = Tag
+        process = self._process_element
+        for element in soup.descendants:
+            if not isinstance(element, tag_type):
+                continue
+            chunk = process(element, position)
             if chunk:
-                chunks.append(chunk)
+                yield chunk
                 position += 1
-        
-        return chunks
     
     def _clean_html_string(self, html_string: str) -> str:
         """Clean and normalize the HTML string."""
-        # Remove any leading/trailing whitespace
-        html_string = html_string.strip()
-        
-        # If the string starts with ```html, remove it
-        if html_string.startswith('```html'):
-            html_string = html_string[7:]
-        
-        # If the string ends with ```, remove it
-        if html_string.endswith('```'):
-            html_string = html_string[:-3]
-        
+        # Strip a surrounding ```html ... ``` fence and whitespace in a
+        # single regex pass instead of repeated strip/slice scans
+        match = _FENCE_RE.match(html_string)
+        if match:
+            return match.group(1)
         return html_string.strip()
     
     def _process_element(self, element: Tag, position: int) -> Optional[ContentChunk]:
         """Process a single HTML element and return a ContentChunk if applicable."""
-        tag_name = element.name.lower()
+        # Intern the tag name: the vocabulary is tiny, the dispatch keys
+        # are compile-time interned literals, and identical objects let the
+        # dict probe short-circuit on pointer equality
+        tag_name = sys.intern(element.name.lower())
         
-        # Skip ignored tags
-        if tag_name in self.ignore_tags:
+        # Single table lookup; None means the tag is ignored
+        handler = self._dispatch.get(tag_name, self._process_unknown)
+        if handler is None:
             return None
         
-        # Get element attributes
-        attributes = dict(element.attrs) if element.attrs else {}
-        
-        # Process based on tag type
-        if tag_name in self.heading_tags:
-            return self._process_heading(element, attributes, position)
-        elif tag_name in self.paragraph_tags:
-            return self._process_paragraph(element, attributes, position)
-        elif tag_name in self.list_tags:
-            return self._process_list(element, attributes, position)
-        elif tag_name in self.table_tags:
-            return self._process_table(element, attributes, position)
-        elif tag_name in self.divider_tags:
-            return self._process_divider(element, attributes, position)
-        elif tag_name in self.image_tags:
-            return self._process_image(element, attributes, position)
-        elif tag_name in self.code_tags:
-            return self._process_code(element, attributes, position)
-        elif tag_name in self.quote_tags:
-            return self._process_quote(element, attributes, position)
-        elif tag_name in self.form_tags:
-            return self._process_form(element, attributes, position)
-        elif tag_name in self.nav_tags:
-            return self._process_navigation(element, attributes, position)
-        elif tag_name in self.footer_tags:
-            return self._process_footer(element, attributes, position)
-        elif tag_name in self.header_tags:
-            return self._process_header(element, attributes, position)
-        elif tag_name in self.structural_tags:
-            return self._process_structural(element, attributes, position)
-        else:
-            return self._process_unknown(element, attributes, position)
-    
-    def _process_heading(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+        # Get element attributes (only for elements that produce chunks);
+        # bs4 already stores them as a dict, so no per-element copy is
+        # needed — downstream code treats the mapping as read-only, and
+        # attribute-less tags carry None rather than a throwaway dict
+        attrs = element.attrs
+        return handler(element, attrs if attrs else None, position)
+    
+    def _process_heading(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process heading elements (h1-h6)."""
         level = int(element.name[1])  # Extract level from tag name (h1 -> 1)
         content = self._extract_text_content(element)
@@ -181,7 +311,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_paragraph(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_paragraph(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process paragraph elements."""
         content = self._extract_text_content(element)
         
@@ -193,7 +323,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_list(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_list(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process list elements (ul, ol, li)."""
         list_type = element.name if element.name in ['ul', 'ol'] else None
         content = self._extract_list_content(element)
@@ -207,10 +337,22 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_table(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_table(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process table elements."""
-        table_info = self._extract_table_info(element)
-        content = self._extract_table_content(element)
+        if element.name == 'table':
+            table_info, content = self._scan_table(element)
+        else:
+            # thead/tbody/tr/th/td carry no table-level metadata
+            table_info = {}
+            if element.name in ('th', 'td'):
+                content = self._extract_text_content(element)
+            else:
+                cells = []
+                for cell in element.find_all(['th', 'td']):
+                    cell_text = self._extract_text_content(cell)
+                    if cell_text:
+                        cells.append(cell_text)
+                content = ' | '.join(cells)
         
         return ContentChunk(
             content_type=ContentType.TABLE,
@@ -221,7 +363,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_divider(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_divider(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process divider elements (hr)."""
         return ContentChunk(
             content_type=ContentType.DIVIDER,
@@ -231,11 +373,17 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_image(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_image(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process image elements."""
-        src = attributes.get('src', '')
-        alt = attributes.get('alt', '')
-        content = f"[Image: {alt}] ({src})" if alt else f"[Image] ({src})"
+        attrs = attributes or {}
+        src = attrs.get('src', '')
+        alt = attrs.get('alt', '')
+        # Plain concatenation skips f-string format machinery on the
+        # per-image path
+        if alt:
+            content = '[Image: ' + alt + '] (' + src + ')'
+        else:
+            content = '[Image] (' + src + ')'
         
         return ContentChunk(
             content_type=ContentType.IMAGE,
@@ -245,7 +393,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_code(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_code(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process code elements."""
         content = self._extract_text_content(element)
         
@@ -257,7 +405,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_quote(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_quote(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process quote elements."""
         content = self._extract_text_content(element)
         
@@ -269,7 +417,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_form(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_form(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process form elements."""
         content = self._extract_form_content(element)
         
@@ -281,7 +429,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_navigation(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_navigation(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process navigation elements."""
         content = self._extract_text_content(element)
         
@@ -293,7 +441,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_footer(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_footer(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process footer elements."""
         content = self._extract_text_content(element)
         
@@ -305,7 +453,7 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_header(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_header(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process header elements."""
         content = self._extract_text_content(element)
         
@@ -317,8 +465,13 @@ class HTMLContentParser:
             position=position
         )
     
-    def _process_structural(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_structural(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process structural elements that might contain content."""
+        # Probe for any non-whitespace text first; stripped_strings yields
+        # lazily, so empty wrappers bail out without the full join below
+        if next(iter(element.stripped_strings), None) is None:
+            return None
+        
         content = self._extract_text_content(element)
         
         if content.strip():
@@ -331,7 +484,7 @@ class HTMLContentParser:
             )
         return None
     
-    def _process_unknown(self, element: Tag, attributes: Dict[str, str], position: int) -> ContentChunk:
+    def _process_unknown(self, element: Tag, attributes: Optional[Dict[str, str]], position: int) -> ContentChunk:
         """Process unknown elements."""
         content = self._extract_text_content(element)
         
@@ -348,18 +501,21 @@ class HTMLContentParser:
         if isinstance(element, NavigableString):
             return str(element).strip()
         
-        # Get direct text content
+        # Get direct text content; locals keep attribute lookups out of
+        # the per-node loop, which runs for every fragment in the document
         text_parts = []
+        append = text_parts.append
+        ignore_tags = self.ignore_tags
         for content in element.contents:
             if isinstance(content, NavigableString):
                 text = str(content).strip()
                 if text:
-                    text_parts.append(text)
-            elif content.name in self.ignore_tags:
+                    append(text)
+            elif content.name in ignore_tags:
                 # Skip ignored tags but get their text content
                 text = self._extract_text_content(content)
                 if text:
-                    text_parts.append(text)
+                    append(text)
         
         return ' '.join(text_parts)
     
@@ -367,42 +523,54 @@ class HTMLContentParser:
         """Extract content from list elements."""
         if element.name == 'li':
             return self._extract_text_content(element)
-        else:
-            # For ul/ol, get all list items
-            items = []
-            for li in element.find_all('li', recursive=False):
-                item_text = self._extract_text_content(li)
-                if item_text:
-                    items.append(f"• {item_text}")
-            return '\n'.join(items)
-    
-    def _extract_table_content(self, element: Tag) -> str:
-        """Extract content from table elements."""
-        if element.name in ['th', 'td']:
-            return self._extract_text_content(element)
-        else:
-            # For table, thead, tbody, tr, get all cells
-            cells = []
-            for cell in element.find_all(['th', 'td']):
-                cell_text = self._extract_text_content(cell)
+        
+        # For ul/ol, walk direct children instead of find_all's filter
+        # machinery; only Tag nodes have a name, so getattr doubles as the
+        # NavigableString check
+        extract = self._extract_text_content
+        return '\n'.join(
+            f"• {item_text}"
+            for child in element.children
+            if getattr(child, 'name', None) == 'li' and (item_text := extract(child))
+        )
+    
+    def _scan_table(self, element: Tag) -> tuple:
+        """Collect table metadata and cell content in a single tree walk.
+
+        Replaces the separate find_all passes for rows, columns, header
+        detection and cell text, which each re-traversed the table.
+        """
+        rows = 0
+        cols = 0
+        current_cols = 0
+        has_header = False
+        cells = []
+        
+        for node in element.descendants:
+            if not isinstance(node, Tag):
+                continue
+            tag = node.name
+            if tag == 'tr':
+                rows += 1
+                current_cols = 0
+            elif tag in ('th', 'td'):
+                current_cols += 1
+                if current_cols > cols:
+                    cols = current_cols
+                if tag == 'th':
+                    has_header = True
+                cell_text = self._extract_text_content(node)
                 if cell_text:
                     cells.append(cell_text)
-            return ' | '.join(cells)
-    
-    def _extract_table_info(self, element: Tag) -> Dict[str, Any]:
-        """Extract table metadata."""
-        if element.name == 'table':
-            rows = element.find_all('tr')
-            cols = 0
-            if rows:
-                cols = max(len(row.find_all(['th', 'td'])) for row in rows)
-            
-            return {
-                'rows': len(rows),
-                'columns': cols,
-                'has_header': bool(element.find('thead') or element.find('th'))
-            }
-        return {}
+            elif tag == 'thead':
+                has_header = True
+        
+        table_info = {
+            'rows': rows,
+            'columns': cols,
+            'has_header': has_header
+        }
+        return table_info, ' | '.join(cells)
     
     def _extract_form_content(self, element: Tag) -> str:
         """Extract content from form elements."""
@@ -423,11 +591,8 @@ class HTMLContentParser:
     
     def get_chunks_summary(self, chunks: List[ContentChunk]) -> Dict[str, int]:
         """Get a summary of chunk types and their counts."""
-        summary = {}
-        for chunk in chunks:
-            chunk_type = chunk.content_type.value
-            summary[chunk_type] = summary.get(chunk_type, 0) + 1
-        return summary
+        counts = Counter(chunk.content_type for chunk in chunks)
+        return {content_type.value: count for content_type, count in counts.items()}
     
     def print_chunks(self, chunks: List[ContentChunk], show_attributes: bool = False):
         """Print chunks in a readable format."""
@@ -460,6 +625,32 @@ def parse_html_content(html_string: str) -> List[ContentChunk]:
     return parser.parse_html(html_string)
 
 
+def parse_html_batch(html_strings: List[str], workers: Optional[int] = None) -> List[List[ContentChunk]]:
+    """
+    Parse many HTML documents in parallel, one document per worker process.
+
+    Parsing is CPU-bound and documents are independent, so throughput
+    scales with cores; per-document latency is unchanged. ContentChunk is a
+    dataclass and pickles cleanly across the process boundary.
+
+    Args:
+        html_strings: The HTML strings to parse
+        workers: Number of worker processes (defaults to the core count)
+
+    Returns:
+        One list of ContentChunk objects per input document, in order
+    """
+    if len(html_strings) <= 1:
+        return [parse_html_content(html) for html in html_strings]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunksize = max(1, len(html_strings) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_html_content, html_strings, chunksize=chunksize))
+
+
 def chunks_to_json(chunks: List[ContentChunk]) -> List[Dict[str, Any]]:
     """
     Convert a list of ContentChunk objects to JSON-serializable format.
@@ -473,23 +664,27 @@ def chunks_to_json(chunks: List[ContentChunk]) -> List[Dict[str, Any]]:
     return [chunk.to_dict() for chunk in chunks]
 
 
-def save_chunks_to_json(chunks: List[ContentChunk], filename: str):
+def save_chunks_to_json(chunks, filename: str):
     """
-    Save a list of ContentChunk objects to a JSON file.
+    Save ContentChunk objects to a JSON file.
+    
+    Accepts any iterable of chunks (including the iter_chunks generator)
+    and streams one record at a time, so peak memory stays independent of
+    document size.
     
     Args:
-        chunks: List of ContentChunk objects
+        chunks: Iterable of ContentChunk objects
         filename: Output JSON filename
     """
-    import json
-    import os
-    
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    # Ensure directory exists (Path handles bare filenames too)
+    Path(filename).parent.mkdir(parents=True, exist_ok=True)
     
-    # Convert to JSON-serializable format
-    json_data = chunks_to_json(chunks)
-    
-    # Write to file
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False) 
\ No newline at end of file
+    # 1MB buffer batches the per-record writes into few syscalls
+    with open(filename, 'wb', buffering=1 << 20) as f:
+        f.write(b'[')
+        first = True
+        for chunk in chunks:
+            f.write(b'\n  ' if first else b',\n  ')
+            f.write(orjson.dumps(chunk.to_dict()))
+            first = False
+        f.write(b'\n]' if not first else b']')
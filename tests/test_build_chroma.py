@@ -0,0 +1,135 @@
+"""
+Tests for the ChromaDB ingestion helpers.
+
+Run from the repository root with:
+    python -m unittest tests.test_build_chroma
+"""
+
+import os
+import tempfile
+import unittest
+
+# Must be set before the module under test reads it at import time
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+import chromadb
+from chromadb.config import Settings
+
+from src.build_chroma import CachedEmbeddingFunction, ChromaDocumentIngester
+
+
+def _counting_embedder(texts):
+    """Deterministic stand-in embedder that records how often it is called."""
+    _counting_embedder.calls += 1
+    return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+
+class CachedEmbeddingFunctionTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        _counting_embedder.calls = 0
+        self.ef = CachedEmbeddingFunction(
+            _counting_embedder,
+            cache_path=os.path.join(self._tmp.name, "embedding_cache.sqlite3")
+        )
+
+    def _client(self):
+        return chromadb.PersistentClient(
+            path=os.path.join(self._tmp.name, "chroma_db"),
+            settings=Settings(anonymized_telemetry=False, allow_reset=False)
+        )
+
+    def test_create_collection_through_wrapper(self):
+        # get_or_create_collection validates the embedding function it is
+        # handed; the wrapper must satisfy Chroma's protocol (name, config)
+        collection = self._client().get_or_create_collection(
+            name="wrapper_test",
+            embedding_function=self.ef
+        )
+
+        collection.add(documents=["hello", "wider world"], ids=["a", "b"])
+        self.assertEqual(collection.count(), 2)
+
+        results = collection.query(query_texts=["hello"], n_results=1)
+        self.assertEqual(results["ids"], [["a"]])
+
+    def test_cache_short_circuits_repeat_embeddings(self):
+        collection = self._client().get_or_create_collection(
+            name="cache_test",
+            embedding_function=self.ef
+        )
+
+        collection.add(documents=["hello", "world"], ids=["a", "b"])
+        self.assertEqual(_counting_embedder.calls, 1)
+
+        # The same texts again must be served entirely from the cache
+        collection.add(documents=["hello", "world"], ids=["c", "d"])
+        self.assertEqual(_counting_embedder.calls, 1)
+
+    def test_config_round_trip(self):
+        config = self.ef.get_config()
+        self.assertEqual(config["cache_path"], self.ef._cache_path)
+        self.assertIsInstance(CachedEmbeddingFunction.name(), str)
+
+
+class IngestRecordsBatchedTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        _counting_embedder.calls = 0
+        self.ingester = ChromaDocumentIngester(persist_directory=self._tmp.name)
+        self.ingester.embedding_function = CachedEmbeddingFunction(
+            _counting_embedder,
+            cache_path=os.path.join(self._tmp.name, "embedding_cache.sqlite3")
+        )
+
+    @staticmethod
+    def _paper(source_name, title, n_chunks):
+        return (source_name, [
+            {"id": j, "content": f"{title} chunk {j} text",
+             "metadata": {"name": title, "type": "paragraph", "token_count": 3,
+                          "position": j, "tag_name": "p", "html_class": ""}}
+            for j in range(n_chunks)
+        ])
+
+    def test_failed_flush_fails_its_sources_and_spares_others(self):
+        # The big paper exceeds batch_size, so it triggers its own in-loop
+        # flush — the path where a failure must not be overwritten by the
+        # provisional success that is staged for the same source
+        batch_size = 200
+        papers = [
+            self._paper("paperA.json", "Paper A", 250),
+            self._paper("paperB.json", "Paper B", 5),
+        ]
+
+        broken = self.ingester.create_or_get_collection("Paper A")
+        intact = self.ingester.create_or_get_collection("Paper B")
+
+        def boom(**kwargs):
+            raise RuntimeError("simulated add failure")
+        broken.add = boom
+
+        results = self.ingester.ingest_records_batched(papers, batch_size=batch_size)
+
+        self.assertEqual(results, {"paperA.json": False, "paperB.json": True})
+        self.assertEqual(intact.count(), 5)
+
+        # Only the successful source may reach the manifest
+        self.assertNotIn("paperA.json", self.ingester._manifest)
+        self.assertEqual(self.ingester._manifest["paperB.json"]["chunks"], 5)
+
+    def test_successful_sources_recorded_in_manifest(self):
+        results = self.ingester.ingest_records_batched(
+            [self._paper("paperC.json", "Paper C", 250)], batch_size=200
+        )
+
+        self.assertEqual(results, {"paperC.json": True})
+        self.assertEqual(self.ingester.create_or_get_collection("Paper C").count(), 250)
+        self.assertEqual(self.ingester._manifest["paperC.json"]["chunks"], 250)
+
+
+if __name__ == "__main__":
+    unittest.main()